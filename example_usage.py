@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
 
 from jp_segment import segment
@@ -38,7 +39,7 @@ def collect_matches(text: str) -> list[MatchResult]:
         cleaned_text = _CLEAN_RE.sub("", info.text).replace("ッー", "")
         if not cleaned_text:
             continue
-        copy_info = WordInfo(**info.__dict__)
+        copy_info = copy.copy(info)
         copy_info.text = cleaned_text
         cleaned.append(copy_info)
 
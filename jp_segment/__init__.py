@@ -1,5 +1,5 @@
 from __future__ import annotations
 
-from .segmenter import Segmenter, segment
+from .segmenter import Segmenter, segment, segment_batch, segment_cached
 
-__all__ = ["Segmenter", "segment"]
+__all__ = ["Segmenter", "segment", "segment_batch", "segment_cached"]
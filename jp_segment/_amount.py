@@ -2,9 +2,17 @@ from __future__ import annotations
 
 from ._amount_data import COMBINATIONS as _COMBINATIONS
 
-_COMBINATION_CACHE: set[tuple[str, str]] = set(_COMBINATIONS)
 
+def _group_by_first(combinations: set[tuple[str, str]]) -> dict[str, frozenset[str]]:
+    grouped: dict[str, set[str]] = {}
+    for first, second in combinations:
+        grouped.setdefault(first, set()).add(second)
+    return {first: frozenset(seconds) for first, seconds in grouped.items()}
 
-def load_amount_combinations() -> set[tuple[str, str]]:
-    """Return the set of amount combinations ported from Jiten."""
-    return _COMBINATION_CACHE
+
+_COMBO_BY_FIRST: dict[str, frozenset[str]] = _group_by_first(_COMBINATIONS)
+
+
+def load_amount_combinations_by_first() -> dict[str, frozenset[str]]:
+    """Return the amount combinations ported from Jiten, grouped by their leading amount text."""
+    return _COMBO_BY_FIRST
@@ -1,22 +1,126 @@
 from __future__ import annotations
 
+import copy
 import re
 
-from ._amount import load_amount_combinations
+from ._amount import load_amount_combinations_by_first
 from ._types import (
     PartOfSpeech,
     PartOfSpeechSection,
 )
-from ._wordinfo import WordInfo
+from ._wordinfo import WordInfo, section_mask
 
 HONORIFICS_SUFFIXES = ["さん", "ちゃん", "くん"]
+_HONORIFICS_TUPLE = tuple(HONORIFICS_SUFFIXES)
 _MIN_PAIR_LENGTH = 2
 _MIN_TRIPLE_LENGTH = 3
 _DOUBLE_CHAR_LENGTH = 2
-_HIRAGANA_START = 0x3040
-_KATAKANA_END = 0x30FF
-_HALF_KATAKANA_START = 0xFF66
-_HALF_KATAKANA_END = 0xFF9D
+_NO_COMBINATIONS: frozenset[str] = frozenset()
+
+# Enum members used by the passes, resolved once: looking a member up on its
+# Enum class is several times slower than reading a module global.
+_NOUN = PartOfSpeech.Noun
+_VERB = PartOfSpeech.Verb
+_ADVERB = PartOfSpeech.Adverb
+_PARTICLE = PartOfSpeech.Particle
+_CONJUNCTION = PartOfSpeech.Conjunction
+_AUXILIARY = PartOfSpeech.Auxiliary
+_INTERJECTION = PartOfSpeech.Interjection
+_PREFIX = PartOfSpeech.Prefix
+_PRONOUN = PartOfSpeech.Pronoun
+_SUFFIX = PartOfSpeech.Suffix
+_EXPRESSION = PartOfSpeech.Expression
+_NUMERAL = PartOfSpeech.Numeral
+_COUNTER = PartOfSpeech.Counter
+_SECTION_NONE = PartOfSpeechSection.None_
+
+# WordInfo.sections_mask bits tested by the passes
+_AMOUNT_OR_NUMERAL_MASK = section_mask(PartOfSpeechSection.Amount, PartOfSpeechSection.Numeral)
+_SUFFIX_SECTION_MASK = section_mask(PartOfSpeechSection.Suffix)
+_DEPENDANT_MASK = section_mask(PartOfSpeechSection.Dependant)
+_CONJUNCTION_PARTICLE_MASK = section_mask(PartOfSpeechSection.ConjunctionParticle)
+_AUXILIARY_VERB_STEM_MASK = section_mask(PartOfSpeechSection.AuxiliaryVerbStem)
+_ADVERBIAL_PARTICLE_MASK = section_mask(PartOfSpeechSection.AdverbialParticle)
+_NAME_MASK = section_mask(PartOfSpeechSection.PersonName, PartOfSpeechSection.ProperNoun)
+_POSSIBLE_DEPENDANT_MASK = section_mask(PartOfSpeechSection.PossibleDependant)
+_POSSIBLE_SURU_MASK = section_mask(PartOfSpeechSection.PossibleSuru)
+_ADJECTIVAL_MASK = section_mask(PartOfSpeechSection.Adjectival)
+
+_NA_NI = frozenset({"な", "に"})
+_POSSIBLE_DEPENDANT_FORMS = frozenset(
+    {"得る", "する", "しまう", "おる", "きる", "こなす", "いく", "貰う", "いる", "ない"}
+)
+_SURU_SURFACES = frozenset({"する", "しない"})
+_TARI_FORMS = frozenset({"だり", "たり"})
+_CONJUNCTIVE_PARTICLES = frozenset({"て", "で", "ちゃ", "ば"})
+_CONJUNCTIVE_PARTICLE_HOSTS = frozenset({PartOfSpeech.Verb, PartOfSpeech.IAdjective, PartOfSpeech.Auxiliary})
+_CONJUGATABLE_POS = frozenset(
+    {PartOfSpeech.Verb, PartOfSpeech.IAdjective, PartOfSpeech.NaAdjective, PartOfSpeech.Auxiliary}
+)
+_DESU_PAST = frozenset({"でし", "でした"})
+_AUXILIARY_EXCLUDED_FORMS = frozenset({"らしい", "べし", "ようだ", "やがる"})
+_AUXILIARY_EXCLUDED_SURFACES = frozenset({"なら", "だろう"})
+_AUXILIARY_STEM_EXCLUDED = frozenset({"ように", "よう", "みたい"})
+_VERB_OR_I_ADJECTIVE = frozenset({PartOfSpeech.Verb, PartOfSpeech.IAdjective})
+_SUFFIX_FORMS = frozenset({"っこ", "さ", "がる"})
+_MISPARSED_PREFIXES = frozenset({"なん", "フン", "ふん"})
+_LOOSE_KANA_WORDS = frozenset({"エナ", "えな"})
+_MISPARSED_FRAGMENTS = frozenset({"そ", "ー", "る", "ま", "ふ", "ち", "ほ", "す", "じ", "なさ"})
+
+
+_SPECIAL3_RULES = (
+    ("な", "の", "で", PartOfSpeech.Expression),
+    ("で", "は", "ない", PartOfSpeech.Expression),
+    ("それ", "で", "も", PartOfSpeech.Conjunction),
+    ("なく", "なっ", "た", PartOfSpeech.Verb),
+)
+_SPECIAL2_RULES = (
+    ("じゃ", "ない", PartOfSpeech.Expression),
+    ("ええ", "と", PartOfSpeech.Interjection),
+    ("どっち", "も", PartOfSpeech.Expression),
+    ("そう", "かもしれない", PartOfSpeech.Expression),
+    ("ファイル", "名", PartOfSpeech.Noun),
+    ("に", "しろ", PartOfSpeech.Expression),
+    ("だ", "けど", PartOfSpeech.Conjunction),
+    ("だ", "が", PartOfSpeech.Conjunction),
+    ("で", "さえ", PartOfSpeech.Expression),
+    ("で", "すら", PartOfSpeech.Expression),
+    ("と", "いう", PartOfSpeech.Expression),
+    ("と", "か", PartOfSpeech.Conjunction),
+    ("だ", "から", PartOfSpeech.Conjunction),
+    ("これ", "まで", PartOfSpeech.Expression),
+    ("それ", "も", PartOfSpeech.Conjunction),
+    ("それ", "だけ", PartOfSpeech.Noun),
+    ("くせ", "に", PartOfSpeech.Conjunction),
+    ("の", "で", PartOfSpeech.Particle),
+    ("誰", "も", PartOfSpeech.Expression),
+    ("誰", "か", PartOfSpeech.Expression),
+    ("すぐ", "に", PartOfSpeech.Adverb),
+    ("なん", "か", PartOfSpeech.Particle),
+    ("だっ", "た", PartOfSpeech.Expression),
+    ("だっ", "たら", PartOfSpeech.Conjunction),
+    ("よう", "に", PartOfSpeech.Expression),
+    ("ん", "です", PartOfSpeech.Expression),
+    ("ん", "だ", PartOfSpeech.Expression),
+    ("です", "か", PartOfSpeech.Expression),
+)
+
+# First-token index over the rules above: text -> following text(s) -> POS
+_SPECIAL3: dict[str, dict[tuple[str, str], PartOfSpeech]] = {}
+for _a, _b, _c, _pos in _SPECIAL3_RULES:
+    _SPECIAL3.setdefault(_a, {})[_b, _c] = _pos
+_SPECIAL2: dict[str, dict[str, PartOfSpeech]] = {}
+for _a, _b, _pos in _SPECIAL2_RULES:
+    _SPECIAL2.setdefault(_a, {})[_b] = _pos
+del _a, _b, _c, _pos
+
+# Particle pairs merged by combine_particles: first text -> following texts
+_PARTICLE_PAIRS: dict[str, frozenset[str]] = {
+    "に": frozenset({"は"}),
+    "と": frozenset({"は"}),
+    "で": frozenset({"は"}),
+    "の": frozenset({"に"}),
+}
 
 
 _re_clean = re.compile(
@@ -25,522 +129,483 @@ _re_clean = re.compile(
     r"\uFF5B-\uFF60\uFF62-\uFF65\uFF0E\n\u2026\u3000\u2015\u2500()。\uFF01\uFF1F「」\uFF09]"
 )
 
+# Hiragana, katakana and halfwidth katakana
+_kana_re = re.compile(r"[\u3040-\u30FF\uFF66-\uFF9D]*")
+
+# Jiten's chain of replaces around brackets and sentence ends. No expansion
+# contains a character rewritten by another one, so a single translate pass
+# gives the same result.
+_PREPROCESS_TABLE = str.maketrans(
+    {
+        "「": "\n「 ",
+        "」": " 」\n",
+        "〈": " \n〈 ",
+        "〉": " 〉\n",
+        "《": " \n《 ",
+        "》": " 》\n",
+        "“": " \n“ ",
+        "”": " ”\n",
+        "―": " ― ",
+        "。": " 。\n",
+        "\uff01": " \uff01\n",
+        "\uff1f": " \uff1f\n",
+    }
+)
+
 
 def preprocess_text(text: str) -> str:
-    # Mirrors MorphologicalAnalyser.PreprocessText
-    text = text.replace("<", " ").replace(">", " ")
+    # Mirrors MorphologicalAnalyser.PreprocessText. Jiten first turns "<" and
+    # ">" into spaces and also rewrites "\u2026\r", but _re_clean drops "<",
+    # ">" and "\r", so only the "\u2026\n" rewrite is left to do.
     text = _re_clean.sub("", text)
-    text = text.replace("「", "\n「 ")
-    text = text.replace("」", " 」\n")
-    text = text.replace("〈", " \n〈 ")
-    text = text.replace("〉", " 〉\n")
-    text = text.replace("《", " \n《 ")
-    text = text.replace("》", " 》\n")
-    text = text.replace("“", " \n“ ")
-    text = text.replace("”", " ”\n")
-    text = text.replace("―", " ― ")
-    text = text.replace("。", " 。\n")
-    text = text.replace("\uff01", " \uff01\n")
-    text = text.replace("\uff1f", " \uff1f\n")
-    return text.replace("\u2026\r", "。\r").replace("\u2026\n", "。\n")
+    return text.translate(_PREPROCESS_TABLE).replace("\u2026\n", "。\n")
 
 
 def process_special_cases(word_infos: list[WordInfo]) -> list[WordInfo]:
     if not word_infos:
         return word_infos
-    special3 = {
-        ("な", "の", "で", PartOfSpeech.Expression),
-        ("で", "は", "ない", PartOfSpeech.Expression),
-        ("それ", "で", "も", PartOfSpeech.Conjunction),
-        ("なく", "なっ", "た", PartOfSpeech.Verb),
-    }
-    special2 = {
-        ("じゃ", "ない", PartOfSpeech.Expression),
-        ("ええ", "と", PartOfSpeech.Interjection),
-        ("どっち", "も", PartOfSpeech.Expression),
-        ("そう", "かもしれない", PartOfSpeech.Expression),
-        ("ファイル", "名", PartOfSpeech.Noun),
-        ("に", "しろ", PartOfSpeech.Expression),
-        ("だ", "けど", PartOfSpeech.Conjunction),
-        ("だ", "が", PartOfSpeech.Conjunction),
-        ("で", "さえ", PartOfSpeech.Expression),
-        ("で", "すら", PartOfSpeech.Expression),
-        ("と", "いう", PartOfSpeech.Expression),
-        ("と", "か", PartOfSpeech.Conjunction),
-        ("だ", "から", PartOfSpeech.Conjunction),
-        ("これ", "まで", PartOfSpeech.Expression),
-        ("それ", "も", PartOfSpeech.Conjunction),
-        ("それ", "だけ", PartOfSpeech.Noun),
-        ("くせ", "に", PartOfSpeech.Conjunction),
-        ("の", "で", PartOfSpeech.Particle),
-        ("誰", "も", PartOfSpeech.Expression),
-        ("誰", "か", PartOfSpeech.Expression),
-        ("すぐ", "に", PartOfSpeech.Adverb),
-        ("なん", "か", PartOfSpeech.Particle),
-        ("だっ", "た", PartOfSpeech.Expression),
-        ("だっ", "たら", PartOfSpeech.Conjunction),
-        ("よう", "に", PartOfSpeech.Expression),
-        ("ん", "です", PartOfSpeech.Expression),
-        ("ん", "だ", PartOfSpeech.Expression),
-        ("です", "か", PartOfSpeech.Expression),
-    }
+    # "だし" is split in two, so this pass cannot be done in place
     out: list[WordInfo] = []
+    n = len(word_infos)
     i = 0
-    while i < len(word_infos):
+    while i < n:
         w1 = word_infos[i]
-        if w1.part_of_speech == PartOfSpeech.Conjunction and w1.text == "で":
-            w1 = WordInfo(**{**w1.__dict__, "part_of_speech": PartOfSpeech.Particle})
+        if w1.part_of_speech == _CONJUNCTION and w1.text == "で":
+            w1.part_of_speech = _PARTICLE
             out.append(w1)
             i += 1
             continue
-        if i + 2 < len(word_infos):
+        if i + 2 < n:
             w2 = word_infos[i + 1]
             w3 = word_infos[i + 2]
             if w1.dictionary_form == "する" and w2.text == "て" and w3.dictionary_form == "くださる":
-                neww = WordInfo(**w1.__dict__)
-                neww.text = w1.text + w2.text + w3.text
-                out.append(neww)
+                w1.text = w1.text + w2.text + w3.text
+                out.append(w1)
                 i += 3
                 continue
-            found = False
-            for a, b, c, pos in special3:
-                if w1.text == a and w2.text == b and w3.text == c:
-                    neww = WordInfo(**w1.__dict__)
-                    neww.text = w1.text + w2.text + w3.text
-                    if pos is not None:
-                        neww.part_of_speech = pos
-                    out.append(neww)
-                    i += 3
-                    found = True
-                    break
-            if found:
+            bucket3 = _SPECIAL3.get(w1.text)
+            pos = bucket3.get((w2.text, w3.text)) if bucket3 is not None else None
+            if pos is not None:
+                w1.text = w1.text + w2.text + w3.text
+                w1.part_of_speech = pos
+                out.append(w1)
+                i += 3
                 continue
-        if i + 1 < len(word_infos):
+        if i + 1 < n:
             w2 = word_infos[i + 1]
-            found = False
-            for a, b, pos in special2:
-                if w1.text == a and w2.text == b:
-                    neww = WordInfo(**w1.__dict__)
-                    neww.text = w1.text + w2.text
-                    if pos is not None:
-                        neww.part_of_speech = pos
-                    out.append(neww)
-                    i += 2
-                    found = True
-                    break
-            if found:
+            bucket2 = _SPECIAL2.get(w1.text)
+            pos = bucket2.get(w2.text) if bucket2 is not None else None
+            if pos is not None:
+                w1.text = w1.text + w2.text
+                w1.part_of_speech = pos
+                out.append(w1)
+                i += 2
                 continue
         if w1.text == "でしょう":
-            neww = WordInfo(**w1.__dict__)
-            neww.part_of_speech = PartOfSpeech.Expression
-            neww.pos1 = neww.pos2 = neww.pos3 = PartOfSpeechSection.None_
-            out.append(neww)
+            w1.part_of_speech = _EXPRESSION
+            w1.pos1 = w1.pos2 = w1.pos3 = _SECTION_NONE
+            out.append(w1)
             i += 1
             continue
         if w1.text == "だし":
             da = WordInfo(
                 text="だ",
                 dictionary_form="だ",
-                part_of_speech=PartOfSpeech.Auxiliary,
-                pos1=PartOfSpeechSection.None_,
-                pos2=PartOfSpeechSection.None_,
-                pos3=PartOfSpeechSection.None_,
+                part_of_speech=_AUXILIARY,
+                pos1=_SECTION_NONE,
+                pos2=_SECTION_NONE,
+                pos3=_SECTION_NONE,
                 reading="だ",
             )
             shi = WordInfo(
                 text="し",
                 dictionary_form="し",
-                part_of_speech=PartOfSpeech.Conjunction,
-                pos1=PartOfSpeechSection.None_,
-                pos2=PartOfSpeechSection.None_,
-                pos3=PartOfSpeechSection.None_,
+                part_of_speech=_CONJUNCTION,
+                pos1=_SECTION_NONE,
+                pos2=_SECTION_NONE,
+                pos3=_SECTION_NONE,
                 reading="し",
             )
             out.extend((da, shi))
             i += 1
             continue
-        if w1.text in {"な", "に"}:
-            w1 = WordInfo(**{**w1.__dict__, "part_of_speech": PartOfSpeech.Particle})
+        if w1.text in _NA_NI:
+            w1.part_of_speech = _PARTICLE
         if w1.text == "よう":
-            w1 = WordInfo(**{**w1.__dict__, "part_of_speech": PartOfSpeech.Noun})
+            w1.part_of_speech = _NOUN
         if w1.text == "十五":
-            w1 = WordInfo(**{**w1.__dict__, "part_of_speech": PartOfSpeech.Numeral})
+            w1.part_of_speech = _NUMERAL
         out.append(w1)
         i += 1
     return out
 
 
+# The combine_* passes below merge tokens in place: ``w_idx`` is the write
+# index and never overtakes the read index, so the surviving token absorbs
+# the text of the tokens it swallows and the list is truncated at the end.
+
+
 def combine_prefixes(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    current = WordInfo(**word_infos[0].__dict__)
-    for i in range(1, len(word_infos)):
-        nxt = word_infos[i]
-        if current.part_of_speech == PartOfSpeech.Prefix and current.normalized_form != "御":
-            text = current.text + nxt.text
-            current = WordInfo(**nxt.__dict__)
-            current.text = text
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        current = word_infos[w_idx]
+        nxt = word_infos[r_idx]
+        if current.part_of_speech == _PREFIX and current.normalized_form != "御":
+            nxt.text = current.text + nxt.text
         else:
-            out.append(current)
-            current = WordInfo(**nxt.__dict__)
-    out.append(current)
-    return out
+            w_idx += 1
+        word_infos[w_idx] = nxt
+    del word_infos[w_idx + 1 :]
+    return word_infos
 
 
 def combine_amounts(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    combos = load_amount_combinations()
-    out: list[WordInfo] = []
-    current = WordInfo(**word_infos[0].__dict__)
-    for i in range(1, len(word_infos)):
-        nxt = word_infos[i]
-        if (current.has_section(PartOfSpeechSection.Amount) or current.has_section(PartOfSpeechSection.Numeral)) and (
-            (current.text, nxt.text) in combos
-        ):
-            text = current.text + nxt.text
-            current = WordInfo(**nxt.__dict__)
-            current.text = text
-            current.part_of_speech = PartOfSpeech.Noun
+    combos = load_amount_combinations_by_first()
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        current = word_infos[w_idx]
+        nxt = word_infos[r_idx]
+        if current.sections_mask & _AMOUNT_OR_NUMERAL_MASK and nxt.text in combos.get(current.text, _NO_COMBINATIONS):
+            nxt.text = current.text + nxt.text
+            nxt.part_of_speech = _NOUN
         else:
-            out.append(current)
-            current = WordInfo(**nxt.__dict__)
-    out.append(current)
-    return out
+            w_idx += 1
+        word_infos[w_idx] = nxt
+    del word_infos[w_idx + 1 :]
+    return word_infos
 
 
 def combine_tte(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    current = WordInfo(**word_infos[0].__dict__)
-    for i in range(1, len(word_infos)):
-        nxt = word_infos[i]
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        current = word_infos[w_idx]
+        nxt = word_infos[r_idx]
         if current.text.endswith("っ") and nxt.text.startswith("て"):
             current.text += nxt.text
         else:
-            out.append(current)
-            current = WordInfo(**nxt.__dict__)
-    out.append(current)
-    return out
+            w_idx += 1
+            word_infos[w_idx] = nxt
+    del word_infos[w_idx + 1 :]
+    return word_infos
 
 
 def combine_verb_dependants(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    current = WordInfo(**word_infos[0].__dict__)
-    for i in range(1, len(word_infos)):
-        nxt = word_infos[i]
-        if nxt.has_section(PartOfSpeechSection.Dependant) and current.part_of_speech == PartOfSpeech.Verb:
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        current = word_infos[w_idx]
+        nxt = word_infos[r_idx]
+        if nxt.sections_mask & _DEPENDANT_MASK and current.part_of_speech == _VERB:
             current.text += nxt.text
         else:
-            out.append(current)
-            current = WordInfo(**nxt.__dict__)
-    out.append(current)
-    return out
+            w_idx += 1
+            word_infos[w_idx] = nxt
+    del word_infos[w_idx + 1 :]
+    return word_infos
 
 
 def combine_verb_possible_dependants(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    current = WordInfo(**word_infos[0].__dict__)
-    for i in range(1, len(word_infos)):
-        nxt = word_infos[i]
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        current = word_infos[w_idx]
+        nxt = word_infos[r_idx]
         if (
-            nxt.has_section(PartOfSpeechSection.PossibleDependant)
-            and current.part_of_speech == PartOfSpeech.Verb
-            and nxt.dictionary_form in {"得る", "する", "しまう", "おる", "きる", "こなす", "いく", "貰う", "いる", "ない"}
+            nxt.sections_mask & _POSSIBLE_DEPENDANT_MASK
+            and current.part_of_speech == _VERB
+            and nxt.dictionary_form in _POSSIBLE_DEPENDANT_FORMS
         ):
             current.text += nxt.text
         else:
-            out.append(current)
-            current = WordInfo(**nxt.__dict__)
-    out.append(current)
-    return out
+            w_idx += 1
+            word_infos[w_idx] = nxt
+    del word_infos[w_idx + 1 :]
+    return word_infos
 
 
 def combine_verb_dependants_suru(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    i = 0
-    while i < len(word_infos):
-        cur = word_infos[i]
-        if i + 1 < len(word_infos):
-            nxt = word_infos[i + 1]
+    n = len(word_infos)
+    w_idx = 0
+    r_idx = 0
+    while r_idx < n:
+        cur = word_infos[r_idx]
+        r_idx += 1
+        if r_idx < n:
+            nxt = word_infos[r_idx]
             if (
-                cur.has_section(PartOfSpeechSection.PossibleSuru)
+                cur.sections_mask & _POSSIBLE_SURU_MASK
                 and nxt.dictionary_form == "する"
-                and nxt.text not in {"する", "しない"}
+                and nxt.text not in _SURU_SURFACES
             ):
-                comb = WordInfo(**cur.__dict__)
-                comb.text += nxt.text
-                comb.part_of_speech = PartOfSpeech.Verb
-                out.append(comb)
-                i += 2
-                continue
-        out.append(WordInfo(**cur.__dict__))
-        i += 1
-    return out
+                cur.text += nxt.text
+                cur.part_of_speech = _VERB
+                r_idx += 1
+        word_infos[w_idx] = cur
+        w_idx += 1
+    del word_infos[w_idx:]
+    return word_infos
 
 
 def combine_verb_dependants_teiru(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_TRIPLE_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    i = 0
-    while i < len(word_infos):
-        cur = word_infos[i]
-        if i + 2 < len(word_infos):
-            n1 = word_infos[i + 1]
-            n2 = word_infos[i + 2]
-            if cur.part_of_speech == PartOfSpeech.Verb and n1.dictionary_form == "て" and n2.dictionary_form == "いる":
-                comb = WordInfo(**cur.__dict__)
-                comb.text += n1.text + n2.text
-                out.append(comb)
-                i += 3
-                continue
-        out.append(WordInfo(**cur.__dict__))
-        i += 1
-    return out
+    n = len(word_infos)
+    w_idx = 0
+    r_idx = 0
+    while r_idx < n:
+        cur = word_infos[r_idx]
+        r_idx += 1
+        if r_idx + 1 < n:
+            n1 = word_infos[r_idx]
+            n2 = word_infos[r_idx + 1]
+            if cur.part_of_speech == _VERB and n1.dictionary_form == "て" and n2.dictionary_form == "いる":
+                cur.text += n1.text + n2.text
+                r_idx += 2
+        word_infos[w_idx] = cur
+        w_idx += 1
+    del word_infos[w_idx:]
+    return word_infos
 
 
 def combine_adverbial_particle(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    current = WordInfo(**word_infos[0].__dict__)
-    for i in range(1, len(word_infos)):
-        nxt = word_infos[i]
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        current = word_infos[w_idx]
+        nxt = word_infos[r_idx]
         if (
-            nxt.has_section(PartOfSpeechSection.AdverbialParticle)
-            and nxt.dictionary_form in {"だり", "たり"}
-            and current.part_of_speech == PartOfSpeech.Verb
+            nxt.sections_mask & _ADVERBIAL_PARTICLE_MASK
+            and nxt.dictionary_form in _TARI_FORMS
+            and current.part_of_speech == _VERB
         ):
             current.text += nxt.text
         else:
-            out.append(current)
-            current = WordInfo(**nxt.__dict__)
-    out.append(current)
-    return out
+            w_idx += 1
+            word_infos[w_idx] = nxt
+    del word_infos[w_idx + 1 :]
+    return word_infos
 
 
 def combine_conjunctive_particle(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = [word_infos[0]]
-    for i in range(1, len(word_infos)):
-        current = word_infos[i]
-        prev = out[-1]
-        combined = False
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        current = word_infos[r_idx]
+        prev = word_infos[w_idx]
         if (
-            current.has_section(PartOfSpeechSection.ConjunctionParticle)
-            and current.text in {"て", "で", "ちゃ", "ば"}
-            and (prev.part_of_speech in {PartOfSpeech.Verb, PartOfSpeech.IAdjective, PartOfSpeech.Auxiliary})
+            current.sections_mask & _CONJUNCTION_PARTICLE_MASK
+            and current.text in _CONJUNCTIVE_PARTICLES
+            and prev.part_of_speech in _CONJUNCTIVE_PARTICLE_HOSTS
         ):
             prev.text += current.text
-            combined = True
-        if not combined:
-            out.append(current)
-    return out
+        else:
+            w_idx += 1
+            word_infos[w_idx] = current
+    del word_infos[w_idx + 1 :]
+    return word_infos
 
 
 def combine_auxiliary(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = [word_infos[0]]
-    for i in range(1, len(word_infos)):
-        cur = word_infos[i]
-        prev = out[-1]
-        if cur.part_of_speech != PartOfSpeech.Auxiliary:
-            out.append(cur)
-            continue
-        prev_conjugatable = prev.part_of_speech in {
-            PartOfSpeech.Verb,
-            PartOfSpeech.IAdjective,
-            PartOfSpeech.NaAdjective,
-            PartOfSpeech.Auxiliary,
-        } or prev.has_section(PartOfSpeechSection.Adjectival)
-        cur_not_na_or_ni = cur.text not in {"な", "に"}
-        desu_sequence_allowed = cur.dictionary_form != "です" or (
-            prev.part_of_speech == PartOfSpeech.Verb and cur.dictionary_form == "です" and cur.text in {"でし", "でした"}
-        )
-        cur_not_aux_form = cur.dictionary_form not in {"らしい", "べし", "ようだ", "やがる"}
-        cur_not_disallowed = cur.text not in {"なら", "だろう"}
-        if prev_conjugatable and cur_not_na_or_ni and desu_sequence_allowed and cur_not_aux_form and cur_not_disallowed:
-            prev.text += cur.text
-        else:
-            out.append(cur)
-    return out
+    # Merging only extends prev.text, so what we know about prev stays valid
+    # until the write index moves; it is worked out on the first auxiliary.
+    prev_known = False
+    prev_conjugatable = prev_is_verb = False
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        cur = word_infos[r_idx]
+        if (
+            cur.part_of_speech == _AUXILIARY
+            and cur.text not in _NA_NI
+            and cur.dictionary_form not in _AUXILIARY_EXCLUDED_FORMS
+            and cur.text not in _AUXILIARY_EXCLUDED_SURFACES
+        ):
+            prev = word_infos[w_idx]
+            if not prev_known:
+                prev_conjugatable = prev.part_of_speech in _CONJUGATABLE_POS or prev.sections_mask & _ADJECTIVAL_MASK != 0
+                prev_is_verb = prev.part_of_speech == _VERB
+                prev_known = True
+            desu_sequence_allowed = cur.dictionary_form != "です" or (prev_is_verb and cur.text in _DESU_PAST)
+            if prev_conjugatable and desu_sequence_allowed:
+                prev.text += cur.text
+                continue
+        w_idx += 1
+        word_infos[w_idx] = cur
+        prev_known = False
+    del word_infos[w_idx + 1 :]
+    return word_infos
 
 
 def combine_auxiliary_verb_stem(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    current = WordInfo(**word_infos[0].__dict__)
-    for i in range(1, len(word_infos)):
-        nxt = word_infos[i]
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        current = word_infos[w_idx]
+        nxt = word_infos[r_idx]
+        # word_infos[r_idx - 1] is still the token read on the previous step
         if (
-            nxt.has_section(PartOfSpeechSection.AuxiliaryVerbStem)
-            and nxt.text not in {"ように", "よう", "みたい"}
-            and word_infos[i - 1].part_of_speech in {PartOfSpeech.Verb, PartOfSpeech.IAdjective}
+            nxt.sections_mask & _AUXILIARY_VERB_STEM_MASK
+            and nxt.text not in _AUXILIARY_STEM_EXCLUDED
+            and word_infos[r_idx - 1].part_of_speech in _VERB_OR_I_ADJECTIVE
         ):
             current.text += nxt.text
         else:
-            out.append(current)
-            current = WordInfo(**nxt.__dict__)
-    out.append(current)
-    return out
+            w_idx += 1
+            word_infos[w_idx] = nxt
+    del word_infos[w_idx + 1 :]
+    return word_infos
 
 
 def combine_suffix(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    current = WordInfo(**word_infos[0].__dict__)
-    for i in range(1, len(word_infos)):
-        nxt = word_infos[i]
-        if (nxt.part_of_speech == PartOfSpeech.Suffix or nxt.has_section(PartOfSpeechSection.Suffix)) and (
-            nxt.dictionary_form in {"っこ", "さ", "がる"}
-            or (nxt.dictionary_form == "ら" and word_infos[i - 1].part_of_speech == PartOfSpeech.Pronoun)
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        current = word_infos[w_idx]
+        nxt = word_infos[r_idx]
+        if (nxt.part_of_speech == _SUFFIX or nxt.sections_mask & _SUFFIX_SECTION_MASK) and (
+            nxt.dictionary_form in _SUFFIX_FORMS
+            or (nxt.dictionary_form == "ら" and word_infos[r_idx - 1].part_of_speech == _PRONOUN)
         ):
             current.text += nxt.text
         else:
-            out.append(current)
-            current = WordInfo(**nxt.__dict__)
-    out.append(current)
-    return out
+            w_idx += 1
+            word_infos[w_idx] = nxt
+    del word_infos[w_idx + 1 :]
+    return word_infos
 
 
 def combine_particles(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    i = 0
-    while i < len(word_infos):
-        cur = word_infos[i]
-        if i + 1 < len(word_infos):
-            nxt = word_infos[i + 1]
-            combined = ""
-            if cur.text == "に" and nxt.text == "は":
-                combined = "には"
-            elif cur.text == "と" and nxt.text == "は":
-                combined = "とは"
-            elif cur.text == "で" and nxt.text == "は":
-                combined = "では"
-            elif cur.text == "の" and nxt.text == "に":
-                combined = "のに"
-            if combined:
-                nw = WordInfo(**cur.__dict__)
-                nw.text = combined
-                out.append(nw)
-                i += 2
-                continue
-        out.append(WordInfo(**cur.__dict__))
-        i += 1
-    return out
+    n = len(word_infos)
+    w_idx = 0
+    r_idx = 0
+    while r_idx < n:
+        cur = word_infos[r_idx]
+        r_idx += 1
+        if r_idx < n:
+            if word_infos[r_idx].text in _PARTICLE_PAIRS.get(cur.text, _NO_COMBINATIONS):
+                cur.text += word_infos[r_idx].text
+                r_idx += 1
+        word_infos[w_idx] = cur
+        w_idx += 1
+    del word_infos[w_idx:]
+    return word_infos
 
 
 def combine_final(word_infos: list[WordInfo]) -> list[WordInfo]:
     if len(word_infos) < _MIN_PAIR_LENGTH:
         return word_infos
-    out: list[WordInfo] = []
-    current = WordInfo(**word_infos[0].__dict__)
-    for i in range(1, len(word_infos)):
-        nxt = word_infos[i]
-        if nxt.text == "ば" and word_infos[i - 1].part_of_speech == PartOfSpeech.Verb:
+    w_idx = 0
+    for r_idx in range(1, len(word_infos)):
+        current = word_infos[w_idx]
+        nxt = word_infos[r_idx]
+        if nxt.text == "ば" and word_infos[r_idx - 1].part_of_speech == _VERB:
             current.text += nxt.text
         else:
-            out.append(current)
-            current = WordInfo(**nxt.__dict__)
-    out.append(current)
-    return out
-
-
-def separate_suffix_honorifics(word_infos: list[WordInfo]) -> list[WordInfo]:
-    if len(word_infos) < _MIN_PAIR_LENGTH:
-        return word_infos
+            w_idx += 1
+            word_infos[w_idx] = nxt
+    del word_infos[w_idx + 1 :]
+    return word_infos
+
+
+def _split_honorific(current: WordInfo) -> WordInfo | None:
+    """Strip an honorific suffix from a name in place and return it as its own token."""
+    text = current.text
+    if not (text.endswith(_HONORIFICS_TUPLE) and current.sections_mask & _NAME_MASK):
+        return None
+    for h in HONORIFICS_SUFFIXES:
+        if text.endswith(h) and len(text) > len(h):
+            current.text = text[: -len(h)]
+            current.dictionary_form = current.dictionary_form.removesuffix(h)
+            return WordInfo(text=h, part_of_speech=_SUFFIX, reading=h, dictionary_form=h)
+    return None
+
+
+def _keep_after_misparse_fixes(ww: WordInfo) -> bool:
+    """Fix up a commonly misparsed token in place; False means it should be dropped."""
+    if ww.text in _MISPARSED_PREFIXES:
+        ww.part_of_speech = _PREFIX
+    if ww.text == "そう":
+        ww.part_of_speech = _ADVERB
+    if ww.text == "おい":
+        ww.part_of_speech = _INTERJECTION
+    if ww.text == "つ" and ww.part_of_speech == _SUFFIX:
+        ww.part_of_speech = _COUNTER
+    is_loose_kana = (
+        (len(ww.text) == 1 and _is_kana_str(ww.text))
+        or (len(ww.text) == _DOUBLE_CHAR_LENGTH and _is_kana_str(ww.text[0]) and ww.text[1] == "ー")
+        or ww.text in _LOOSE_KANA_WORDS
+    )
+    return not (ww.text in _MISPARSED_FRAGMENTS or (ww.part_of_speech == _NOUN and is_loose_kana))
+
+
+def separate_suffix_honorifics_and_filter(word_infos: list[WordInfo]) -> list[WordInfo]:
+    """Split honorific suffixes off names, then drop misparsed fragments.
+
+    Both steps only look at one token at a time, so they share a single scan:
+    each token (and the suffix split off from it) is handled fully before
+    moving on.
+    """
+    split = len(word_infos) >= _MIN_PAIR_LENGTH
     out: list[WordInfo] = []
-    for w in word_infos:
-        current = WordInfo(**w.__dict__)
-        separated = False
-        for h in HONORIFICS_SUFFIXES:
-            if (
-                current.text.endswith(h)
-                and len(current.text) > len(h)
-                and (current.has_section(PartOfSpeechSection.PersonName) or current.has_section(PartOfSpeechSection.ProperNoun))
-            ):
-                current.text = current.text[: -len(h)]
-                current.dictionary_form = current.dictionary_form.removesuffix(h)
-                suffix = WordInfo(text=h, part_of_speech=PartOfSpeech.Suffix, reading=h, dictionary_form=h)
-                out.extend((current, suffix))
-                separated = True
-                break
-        if not separated:
+    for current in word_infos:
+        suffix = _split_honorific(current) if split else None
+        if _keep_after_misparse_fixes(current):
             out.append(current)
-
+        if suffix is not None and _keep_after_misparse_fixes(suffix):
+            out.append(suffix)
     return out
 
 
-def filter_misparse(word_infos: list[WordInfo]) -> list[WordInfo]:
-    res = []
-    for w in word_infos:
-        ww = WordInfo(**w.__dict__)
-        if ww.text in {"なん", "フン", "ふん"}:
-            ww.part_of_speech = PartOfSpeech.Prefix
-        if ww.text == "そう":
-            ww.part_of_speech = PartOfSpeech.Adverb
-        if ww.text == "おい":
-            ww.part_of_speech = PartOfSpeech.Interjection
-        if ww.text == "つ" and ww.part_of_speech == PartOfSpeech.Suffix:
-            ww.part_of_speech = PartOfSpeech.Counter
-        is_loose_kana = (
-            (len(ww.text) == 1 and _is_kana_str(ww.text))
-            or (len(ww.text) == _DOUBLE_CHAR_LENGTH and _is_kana_str(ww.text[0]) and ww.text[1] == "ー")
-            or ww.text in {"エナ", "えな"}
-        )
-        if ww.text in {"そ", "ー", "る", "ま", "ふ", "ち", "ほ", "す", "じ", "なさ"} or (
-            ww.part_of_speech == PartOfSpeech.Noun and is_loose_kana
-        ):
-            continue
-        res.append(ww)
-    return res
-
-
 def _is_kana_str(s: str) -> bool:
-    for ch in str(s):
-        code = ord(ch)
-        if not (_HIRAGANA_START <= code <= _KATAKANA_END or _HALF_KATAKANA_START <= code <= _HALF_KATAKANA_END):
-            return False
-    return True
+    return _kana_re.fullmatch(s) is not None
 
 
 def apply_pipeline(word_infos: list[WordInfo], *, morphemes_only: bool = False) -> list[WordInfo]:
     if morphemes_only:
         return word_infos
+    if not word_infos:
+        return []
 
-    w = word_infos
+    # The passes mutate tokens in place, so run them on private copies.
+    # Only the per-token passes at the end share a scan: every combine pass
+    # has to see the tokens already merged by the passes before it.
+    w = [copy.copy(wi) for wi in word_infos]
     w = process_special_cases(w)
-    w = combine_prefixes(w)
-    w = combine_amounts(w)
-    w = combine_tte(w)
-    w = combine_auxiliary_verb_stem(w)
-    w = combine_adverbial_particle(w)
-    w = combine_suffix(w)
-    w = combine_auxiliary(w)
-    w = combine_verb_dependants(w)
-    w = combine_verb_possible_dependants(w)
-    w = combine_verb_dependants_suru(w)
-    w = combine_verb_dependants_teiru(w)
-    w = combine_conjunctive_particle(w)
-    w = combine_particles(w)
-    w = combine_final(w)
-    w = separate_suffix_honorifics(w)
-    return filter_misparse(w)
+    # The special cases still apply to a lone token (and may split it), but
+    # a single token leaves the combine passes nothing to do
+    if len(w) >= _MIN_PAIR_LENGTH:
+        w = combine_prefixes(w)
+        w = combine_amounts(w)
+        w = combine_tte(w)
+        w = combine_auxiliary_verb_stem(w)
+        w = combine_adverbial_particle(w)
+        w = combine_suffix(w)
+        w = combine_auxiliary(w)
+        w = combine_verb_dependants(w)
+        w = combine_verb_possible_dependants(w)
+        w = combine_verb_dependants_suru(w)
+        w = combine_verb_dependants_teiru(w)
+        w = combine_conjunctive_particle(w)
+        w = combine_particles(w)
+        w = combine_final(w)
+    return separate_suffix_honorifics_and_filter(w)
 
 
 # Note: no extra post-pipeline splitting rules here;
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
-from ctypes import CDLL, c_bool, c_char, c_char_p, c_void_p, cast
+import re
+import threading
+from ctypes import CDLL, c_bool, c_char, c_char_p, c_void_p, string_at
 from pathlib import Path
 
 from ._utils import find_resources_dir, platform_lib_name
 
+# Line placed between texts batched into one native call, and the output
+# it comes back as: a single symbol morpheme followed by EOS
+_TEXT_SEPARATOR = "\x1e"
+_SEPARATOR_OUTPUT_RE = re.compile(r"^\x1e\t[^\n]*\nEOS\n", re.MULTILINE)
+
+# CDLL calls already run without the GIL, but the native library returns
+# garbled output when analyses overlap. Every instance loads the same shared
+# library, so one module-wide lock serializes the calls.
+_NATIVE_LOCK = threading.Lock()
+
 
 class SudachiFFI:
     def __init__(self, lib_path: Path | None = None) -> None:
@@ -31,6 +43,15 @@ class SudachiFFI:
 
         self._lib.free_string.argtypes = [c_void_p]
         self._lib.free_string.restype = None
+        # Config and dictionary paths rarely change between calls
+        self._encoded_paths: dict[Path, bytes] = {}
+
+    def _encode_path(self, path: Path) -> bytes:
+        encoded = self._encoded_paths.get(path)
+        if encoded is None:
+            encoded = str(path).encode("utf-8")
+            self._encoded_paths[path] = encoded
+        return encoded
 
     def process_text(
         self,
@@ -43,15 +64,57 @@ class SudachiFFI:
         wakati: bool = False,
     ) -> str:
         # Encode inputs
-        cfg = str(config_path).encode("utf-8")
-        dic = str(dictionary_path).encode("utf-8")
+        cfg = self._encode_path(config_path)
+        dic = self._encode_path(dictionary_path)
         inp = text.encode("utf-8")
-        ptr = self._lib.process_text_ffi(cfg, inp, dic, c_char(ord(mode)), c_bool(print_all), c_bool(wakati))
-        if not ptr:
-            return ""
-        try:
-            as_cchar_p = cast(ptr, c_char_p)
-            out = as_cchar_p.value.decode("utf-8") if as_cchar_p.value else ""
-        finally:
-            self._lib.free_string(ptr)
-        return out
+        with _NATIVE_LOCK:
+            ptr = self._lib.process_text_ffi(cfg, inp, dic, c_char(ord(mode)), c_bool(print_all), c_bool(wakati))
+            if not ptr:
+                return ""
+            try:
+                raw = string_at(ptr)
+            finally:
+                self._lib.free_string(ptr)
+        return raw.decode("utf-8")
+
+    def process_texts(
+        self,
+        config_path: Path,
+        texts: list[str],
+        dictionary_path: Path,
+        *,
+        mode: str = "C",
+        print_all: bool = True,
+    ) -> list[str]:
+        """Analyze several texts with one native call; one output per text.
+
+        The native library analyzes its input line by line, so the texts are
+        joined with a separator line of their own and the output is split on
+        the morpheme that line produces. Texts containing the separator, or
+        ending in ``\\r`` (which would merge with the following newline), get a
+        call of their own.
+        """
+        outs = [""] * len(texts)
+        batch: list[int] = []
+        parts: list[str] = []
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            if _TEXT_SEPARATOR in text or text.endswith("\r"):
+                outs[i] = self.process_text(config_path, text, dictionary_path, mode=mode, print_all=print_all)
+                continue
+            batch.append(i)
+            parts.append(text if text.endswith("\n") else text + "\n")
+        if not batch:
+            return outs
+        joined = (_TEXT_SEPARATOR + "\n").join(parts)
+        out = self.process_text(config_path, joined, dictionary_path, mode=mode, print_all=print_all)
+        pieces = _SEPARATOR_OUTPUT_RE.split(out)
+        if len(pieces) != len(batch):
+            # Unexpected output framing; do not guess where texts start
+            for i in batch:
+                outs[i] = self.process_text(config_path, texts[i], dictionary_path, mode=mode, print_all=print_all)
+            return outs
+        for i, piece in zip(batch, pieces):
+            outs[i] = piece
+        return outs
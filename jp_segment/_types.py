@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from enum import IntEnum
 
 
@@ -93,206 +94,151 @@ class PartOfSpeechSection(IntEnum):
     TaruAdjective = 56
 
 
+# Tag string -> enum, built once. Sudachi and JMdict tags share the tables;
+# where the old if-chains listed a tag twice, the first entry wins.
+_POS_BY_TAG: dict[str, PartOfSpeech] = {}
+for _keys, _value in (
+    (("名詞", "n"), PartOfSpeech.Noun),
+    (("動詞",), PartOfSpeech.Verb),
+    (("形容詞", "adj-i", "adj-ix"), PartOfSpeech.IAdjective),
+    (("形状詞", "adj-na"), PartOfSpeech.NaAdjective),
+    (("副詞", "adv"), PartOfSpeech.Adverb),
+    (("助詞", "prt"), PartOfSpeech.Particle),
+    (("接続詞", "conj"), PartOfSpeech.Conjunction),
+    (("助動詞", "aux", "aux-v"), PartOfSpeech.Auxiliary),
+    (("感動詞", "int"), PartOfSpeech.Interjection),
+    (("記号",), PartOfSpeech.Symbol),
+    (("接頭詞", "接頭辞", "pref"), PartOfSpeech.Prefix),
+    (("フィラー",), PartOfSpeech.Filler),
+    (
+        (
+            "名",
+            "company",
+            "given",
+            "place",
+            "person",
+            "product",
+            "ship",
+            "surname",
+            "unclass",
+            "name-fem",
+            "name-masc",
+            "station",
+            "group",
+            "char",
+            "creat",
+            "dei",
+            "doc",
+            "ev",
+            "fem",
+            "fict",
+            "leg",
+            "masc",
+            "myth",
+            "obj",
+            "organization",
+            "oth",
+            "relig",
+            "serv",
+            "work",
+            "unc",
+        ),
+        PartOfSpeech.Name,
+    ),
+    (("代名詞", "pn"), PartOfSpeech.Pronoun),
+    (("接尾辞", "suf"), PartOfSpeech.Suffix),
+    (("普通名詞",), PartOfSpeech.CommonNoun),
+    (("補助記号",), PartOfSpeech.SupplementarySymbol),
+    (("空白",), PartOfSpeech.BlankSpace),
+    (("表現", "exp"), PartOfSpeech.Expression),
+    (("形動", "adj-no", "adj-t", "adj-f"), PartOfSpeech.NominalAdjective),
+    (("連体詞", "adj-pn"), PartOfSpeech.PrenounAdjectival),
+    (("数詞", "num"), PartOfSpeech.Numeral),
+    (("助数詞", "ctr"), PartOfSpeech.Counter),
+    (("副詞的と", "adv-to"), PartOfSpeech.AdverbTo),
+    (("名詞接尾辞", "n-suf"), PartOfSpeech.NounSuffix),
+):
+    for _key in _keys:
+        _POS_BY_TAG.setdefault(_key, _value)
+
+_SECTION_BY_TAG: dict[str, PartOfSpeechSection] = {}
+for _keys, _value in (
+    (("*",), PartOfSpeechSection.None_),
+    (("数",), PartOfSpeechSection.Amount),
+    (("アルファベット",), PartOfSpeechSection.Alphabet),
+    (("句点",), PartOfSpeechSection.FullStop),
+    (("空白",), PartOfSpeechSection.BlankSpace),
+    (("接尾", "suf"), PartOfSpeechSection.Suffix),
+    (("代名詞", "pn"), PartOfSpeechSection.Pronoun),
+    (("自立",), PartOfSpeechSection.Independant),
+    (("フィラー",), PartOfSpeechSection.Filler),
+    (("一般",), PartOfSpeechSection.Common),
+    (("非自立",), PartOfSpeechSection.Dependant),
+    (("終助詞",), PartOfSpeechSection.SentenceEndingParticle),
+    (("助数詞", "ctr"), PartOfSpeechSection.Counter),
+    (("並立助詞",), PartOfSpeechSection.ParallelMarker),
+    (("係助詞",), PartOfSpeechSection.BindingParticle),
+    (("副詞可能",), PartOfSpeechSection.PotentialAdverb),
+    (("格助詞",), PartOfSpeechSection.CaseMarkingParticle),
+    (("サ変接続",), PartOfSpeechSection.IrregularConjunction),
+    (("接続助詞",), PartOfSpeechSection.ConjunctionParticle),
+    (("助動詞語幹",), PartOfSpeechSection.AuxiliaryVerbStem),
+    (("形容動詞語幹",), PartOfSpeechSection.AdjectivalStem),
+    (("連語",), PartOfSpeechSection.CompoundWord),
+    (("引用",), PartOfSpeechSection.Quotation),
+    (("名詞接続",), PartOfSpeechSection.NounConjunction),
+    (("副助詞",), PartOfSpeechSection.AdverbialParticle),
+    (("助詞類接続",), PartOfSpeechSection.ConjunctiveParticleClass),
+    (("副詞化",), PartOfSpeechSection.Adverbialization),
+    (
+        ("副助詞\uff0f並立助詞\uff0f終助詞",),
+        PartOfSpeechSection.AdverbialParticleOrParallelMarkerOrSentenceEndingParticle,
+    ),
+    (("連体化",), PartOfSpeechSection.AdnominalAdjective),
+    (("固有名詞",), PartOfSpeechSection.ProperNoun),
+    (("特殊",), PartOfSpeechSection.Special),
+    (("動詞接続",), PartOfSpeechSection.VerbConjunction),
+    (("人名",), PartOfSpeechSection.PersonName),
+    (("姓",), PartOfSpeechSection.FamilyName),
+    (("組織",), PartOfSpeechSection.Organization),
+    (("ナイ形容詞語幹",), PartOfSpeechSection.NotAdjectiveStem),
+    (("読点",), PartOfSpeechSection.Comma),
+    (("括弧開",), PartOfSpeechSection.OpeningBracket),
+    (("括弧閉",), PartOfSpeechSection.ClosingBracket),
+    (("地域",), PartOfSpeechSection.Region),
+    (("国",), PartOfSpeechSection.Country),
+    (("数詞", "num"), PartOfSpeechSection.Numeral),
+    (("非自立可能",), PartOfSpeechSection.PossibleDependant),
+    (("普通名詞",), PartOfSpeechSection.CommonNoun),
+    (("名詞的",), PartOfSpeechSection.SubstantiveAdjective),
+    (("助数詞可能",), PartOfSpeechSection.PossibleCounterWord),
+    (("サ変可能",), PartOfSpeechSection.PossibleSuru),
+    (("準体助詞",), PartOfSpeechSection.Juntaijoushi),
+    (("形状詞可能",), PartOfSpeechSection.PossibleNaAdjective),
+    (("動詞的",), PartOfSpeechSection.VerbLike),
+    (("サ変形状詞可能",), PartOfSpeechSection.PossibleVerbSuruNoun),
+    (("形容詞的",), PartOfSpeechSection.Adjectival),
+    (("名",), PartOfSpeechSection.Name),
+    (("文字",), PartOfSpeechSection.Letter),
+    (("形状詞的",), PartOfSpeechSection.NaAdjectiveLike),
+    (("地名",), PartOfSpeechSection.PlaceName),
+    (("タリ",), PartOfSpeechSection.TaruAdjective),
+):
+    for _key in _keys:
+        _SECTION_BY_TAG.setdefault(_key, _value)
+del _keys, _key, _value
+
+
+# The tag vocabulary is small, and the cached call is cheaper than the lookup
+@functools.lru_cache(maxsize=1024)
 def to_part_of_speech(pos: str) -> PartOfSpeech:
-    p = pos
-    if p in {"名詞", "n"}:
-        return PartOfSpeech.Noun
-    if p == "動詞" or p.startswith("v"):
-        return PartOfSpeech.Verb
-    if p in {"形容詞", "adj-i", "adj-ix"}:
-        return PartOfSpeech.IAdjective
-    if p in {"形状詞", "adj-na"}:
-        return PartOfSpeech.NaAdjective
-    if p in {"副詞", "adv"}:
-        return PartOfSpeech.Adverb
-    if p in {"助詞", "prt"}:
-        return PartOfSpeech.Particle
-    if p in {"接続詞", "conj"}:
-        return PartOfSpeech.Conjunction
-    if p in {"助動詞", "aux", "aux-v"}:
-        return PartOfSpeech.Auxiliary
-    if p in {"感動詞", "int"}:
-        return PartOfSpeech.Interjection
-    if p == "記号":
-        return PartOfSpeech.Symbol
-    if p in {"接頭詞", "接頭辞", "pref"}:
-        return PartOfSpeech.Prefix
-    if p == "フィラー":
-        return PartOfSpeech.Filler
-    if p in {
-        "名",
-        "company",
-        "given",
-        "place",
-        "person",
-        "product",
-        "ship",
-        "surname",
-        "unclass",
-        "name-fem",
-        "name-masc",
-        "station",
-        "group",
-        "char",
-        "creat",
-        "dei",
-        "doc",
-        "ev",
-        "fem",
-        "fict",
-        "leg",
-        "masc",
-        "myth",
-        "obj",
-        "organization",
-        "oth",
-        "relig",
-        "serv",
-        "work",
-        "unc",
-    }:
-        return PartOfSpeech.Name
-    if p in {"代名詞", "pn"}:
-        return PartOfSpeech.Pronoun
-    if p in {"接尾辞", "suf"}:
-        return PartOfSpeech.Suffix
-    if p == "普通名詞":
-        return PartOfSpeech.CommonNoun
-    if p == "補助記号":
-        return PartOfSpeech.SupplementarySymbol
-    if p == "空白":
-        return PartOfSpeech.BlankSpace
-    if p in {"表現", "exp"}:
-        return PartOfSpeech.Expression
-    if p in {"形動", "adj-no", "adj-t", "adj-f"}:
-        return PartOfSpeech.NominalAdjective
-    if p in {"連体詞", "adj-pn"}:
-        return PartOfSpeech.PrenounAdjectival
-    if p in {"数詞", "num"}:
-        return PartOfSpeech.Numeral
-    if p in {"助数詞", "ctr"}:
-        return PartOfSpeech.Counter
-    if p in {"副詞的と", "adv-to"}:
-        return PartOfSpeech.AdverbTo
-    if p in {"名詞接尾辞", "n-suf"}:
-        return PartOfSpeech.NounSuffix
-    return PartOfSpeech.Unknown
+    found = _POS_BY_TAG.get(pos)
+    if found is not None:
+        return found
+    # JMdict verb tags (v1, v5k, vs-i, ...) all start with "v"
+    return PartOfSpeech.Verb if pos.startswith("v") else PartOfSpeech.Unknown
 
 
+@functools.lru_cache(maxsize=1024)
 def to_pos_section(pos: str) -> PartOfSpeechSection:
-    p = pos
-    if p == "*":
-        return PartOfSpeechSection.None_
-    if p == "数":
-        return PartOfSpeechSection.Amount
-    if p == "アルファベット":
-        return PartOfSpeechSection.Alphabet
-    if p == "句点":
-        return PartOfSpeechSection.FullStop
-    if p == "空白":
-        return PartOfSpeechSection.BlankSpace
-    if p in {"接尾", "suf"}:
-        return PartOfSpeechSection.Suffix
-    if p in {"代名詞", "pn"}:
-        return PartOfSpeechSection.Pronoun
-    if p == "自立":
-        return PartOfSpeechSection.Independant
-    if p == "フィラー":
-        return PartOfSpeechSection.Filler
-    if p == "一般":
-        return PartOfSpeechSection.Common
-    if p == "非自立":
-        return PartOfSpeechSection.Dependant
-    if p == "終助詞":
-        return PartOfSpeechSection.SentenceEndingParticle
-    if p in {"助数詞", "ctr"}:
-        return PartOfSpeechSection.Counter
-    if p == "並立助詞":
-        return PartOfSpeechSection.ParallelMarker
-    if p == "係助詞":
-        return PartOfSpeechSection.BindingParticle
-    if p == "副詞可能":
-        return PartOfSpeechSection.PotentialAdverb
-    if p == "格助詞":
-        return PartOfSpeechSection.CaseMarkingParticle
-    if p == "サ変接続":
-        return PartOfSpeechSection.IrregularConjunction
-    if p == "接続助詞":
-        return PartOfSpeechSection.ConjunctionParticle
-    if p == "助動詞語幹":
-        return PartOfSpeechSection.AuxiliaryVerbStem
-    if p == "形容動詞語幹":
-        return PartOfSpeechSection.AdjectivalStem
-    if p == "連語":
-        return PartOfSpeechSection.CompoundWord
-    if p == "引用":
-        return PartOfSpeechSection.Quotation
-    if p == "名詞接続":
-        return PartOfSpeechSection.NounConjunction
-    if p == "副助詞":
-        return PartOfSpeechSection.AdverbialParticle
-    if p == "助詞類接続":
-        return PartOfSpeechSection.ConjunctiveParticleClass
-    if p == "副詞化":
-        return PartOfSpeechSection.Adverbialization
-    if p == "副助詞\uff0f並立助詞\uff0f終助詞":
-        return PartOfSpeechSection.AdverbialParticleOrParallelMarkerOrSentenceEndingParticle
-    if p == "連体化":
-        return PartOfSpeechSection.AdnominalAdjective
-    if p == "固有名詞":
-        return PartOfSpeechSection.ProperNoun
-    if p == "特殊":
-        return PartOfSpeechSection.Special
-    if p == "動詞接続":
-        return PartOfSpeechSection.VerbConjunction
-    if p == "人名":
-        return PartOfSpeechSection.PersonName
-    if p == "姓":
-        return PartOfSpeechSection.FamilyName
-    if p == "組織":
-        return PartOfSpeechSection.Organization
-    if p == "ナイ形容詞語幹":
-        return PartOfSpeechSection.NotAdjectiveStem
-    if p == "読点":
-        return PartOfSpeechSection.Comma
-    if p == "括弧開":
-        return PartOfSpeechSection.OpeningBracket
-    if p == "括弧閉":
-        return PartOfSpeechSection.ClosingBracket
-    if p == "地域":
-        return PartOfSpeechSection.Region
-    if p == "国":
-        return PartOfSpeechSection.Country
-    if p in {"数詞", "num"}:
-        return PartOfSpeechSection.Numeral
-    if p == "非自立可能":
-        return PartOfSpeechSection.PossibleDependant
-    if p == "普通名詞":
-        return PartOfSpeechSection.CommonNoun
-    if p == "名詞的":
-        return PartOfSpeechSection.SubstantiveAdjective
-    if p == "助数詞可能":
-        return PartOfSpeechSection.PossibleCounterWord
-    if p == "サ変可能":
-        return PartOfSpeechSection.PossibleSuru
-    if p == "準体助詞":
-        return PartOfSpeechSection.Juntaijoushi
-    if p == "形状詞可能":
-        return PartOfSpeechSection.PossibleNaAdjective
-    if p == "動詞的":
-        return PartOfSpeechSection.VerbLike
-    if p == "サ変形状詞可能":
-        return PartOfSpeechSection.PossibleVerbSuruNoun
-    if p == "形容詞的":
-        return PartOfSpeechSection.Adjectival
-    if p == "名":
-        return PartOfSpeechSection.Name
-    if p == "文字":
-        return PartOfSpeechSection.Letter
-    if p == "形状詞的":
-        return PartOfSpeechSection.NaAdjectiveLike
-    if p == "地名":
-        return PartOfSpeechSection.PlaceName
-    if p == "タリ":
-        return PartOfSpeechSection.TaruAdjective
-    return PartOfSpeechSection.None_
+    return _SECTION_BY_TAG.get(pos, PartOfSpeechSection.None_)
@@ -2,48 +2,25 @@ from __future__ import annotations
 
 import os
 import platform
+import re
 from pathlib import Path
 
-_HIRAGANA_START = 0x3040
-_HIRAGANA_END = 0x309F
-_KATAKANA_START = 0x30A0
-_KATAKANA_END = 0x30FF
-_CJK_UNIFIED_START = 0x4E00
-_CJK_UNIFIED_END = 0x9FAF
-_HALF_KATAKANA_START = 0xFF66
-_HALF_KATAKANA_END = 0xFF9D
+# Hiragana, katakana, CJK unified ideographs and halfwidth katakana
+_JAPANESE_CHAR_RE = re.compile(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF\uFF66-\uFF9D]")
+_ASCII_DIGIT_RE = re.compile("[0-9]")
+_FULL_WIDTH_DIGITS = str.maketrans("0123456789", "\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19")
 
 
 def to_full_width_digits(text: str) -> str:
-    mapping = str.maketrans(
-        {
-            "0": "\uff10",
-            "1": "\uff11",
-            "2": "\uff12",
-            "3": "\uff13",
-            "4": "\uff14",
-            "5": "\uff15",
-            "6": "\uff16",
-            "7": "\uff17",
-            "8": "\uff18",
-            "9": "\uff19",
-        }
-    )
-    return text.translate(mapping)
+    # translate() does a table lookup per character; most texts have no ASCII digit at all
+    if _ASCII_DIGIT_RE.search(text) is None:
+        return text
+    return text.translate(_FULL_WIDTH_DIGITS)
 
 
 def is_romaji_only(text: str) -> bool:
     # Conservative: true if no hiragana/katakana/kanji present
-    for ch in text:
-        code = ord(ch)
-        if (
-            _HIRAGANA_START <= code <= _HIRAGANA_END  # Hiragana
-            or _KATAKANA_START <= code <= _KATAKANA_END  # Katakana
-            or _CJK_UNIFIED_START <= code <= _CJK_UNIFIED_END  # CJK Unified Ideographs
-            or _HALF_KATAKANA_START <= code <= _HALF_KATAKANA_END  # Halfwidth Katakana
-        ):
-            return False
-    return True
+    return _JAPANESE_CHAR_RE.search(text) is None
 
 
 def platform_lib_name() -> str | None:
@@ -1,49 +1,152 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import re
+from sys import intern
 
 from ._types import PartOfSpeech, PartOfSpeechSection, to_part_of_speech, to_pos_section
 
-_SUDACHI_MIN_FIELDS = 6
 _POS_PARTS_MIN = 4
-_READING_FIELD_INDEX = 4
 _POS_INDEX_SECOND = 1
 _POS_INDEX_THIRD = 2
 _POS_INDEX_FOURTH = 3
+# A Sudachi output line with at least six columns; captures
+# surface, POS, normalized form, dictionary form and reading. "EOS" and blank
+# lines have no tabs, so they never match.
+_SUDACHI_LINE_RE = re.compile(r"^([^\t\n]*)\t([^\t\n]*)\t([^\t\n]*)\t([^\t\n]*)\t([^\t\n]*)\t[^\n]*$", re.MULTILINE)
+
+# The factories below intern the string fields: tokens come from a small
+# vocabulary (particles, auxiliaries, common words), so repeated surfaces and
+# forms share one object with a cached hash.
+
+
+def section_mask(*sections: PartOfSpeechSection) -> int:
+    """Return the WordInfo.sections_mask bits of the given sections."""
+    mask = 0
+    for s in sections:
+        mask |= 1 << s
+    return mask
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_pos_field(
+    field: str,
+) -> tuple[PartOfSpeech, PartOfSpeechSection, PartOfSpeechSection, PartOfSpeechSection] | None:
+    """Map a Sudachi POS column ("名詞,普通名詞,一般,*,*,*") to its enums; None if too short."""
+    # Sudachi emits a few hundred distinct columns, so one cached probe
+    # replaces the split and four tag lookups per token
+    pos_parts = field.split(",")
+    if len(pos_parts) < _POS_PARTS_MIN:
+        return None
+    return (
+        to_part_of_speech(pos_parts[0]),
+        to_pos_section(pos_parts[_POS_INDEX_SECOND]),
+        to_pos_section(pos_parts[_POS_INDEX_THIRD]),
+        to_pos_section(pos_parts[_POS_INDEX_FOURTH]),
+    )
 
 
-@dataclass
 class WordInfo:
-    text: str = ""
-    part_of_speech: PartOfSpeech = PartOfSpeech.Unknown
-    pos1: PartOfSpeechSection = PartOfSpeechSection.None_
-    pos2: PartOfSpeechSection = PartOfSpeechSection.None_
-    pos3: PartOfSpeechSection = PartOfSpeechSection.None_
-    normalized_form: str = ""
-    dictionary_form: str = ""
-    reading: str = ""
-    is_invalid: bool = False
+    # Written out instead of a dataclass so that pos1..pos3 can be properties:
+    # sections_mask has one bit per section among them, is what the _analyzer
+    # passes test, and is recomputed on every assignment so it cannot go stale
+    __slots__ = (
+        "text",
+        "part_of_speech",
+        "_pos1",
+        "_pos2",
+        "_pos3",
+        "normalized_form",
+        "dictionary_form",
+        "reading",
+        "is_invalid",
+        "sections_mask",
+    )
 
-    @classmethod
-    def from_sudachi_line(cls, line: str) -> WordInfo:
-        parts = line.split("\t")
-        if len(parts) < _SUDACHI_MIN_FIELDS:
-            return cls(is_invalid=True)
-        pos_parts = parts[1].split(",")
-        if len(pos_parts) < _POS_PARTS_MIN:
-            return cls(is_invalid=True)
-        reading = parts[_READING_FIELD_INDEX] if len(parts) > _READING_FIELD_INDEX else ""
-        return cls(
-            text=parts[0],
-            part_of_speech=to_part_of_speech(pos_parts[0]),
-            pos1=to_pos_section(pos_parts[_POS_INDEX_SECOND]),
-            pos2=to_pos_section(pos_parts[_POS_INDEX_THIRD]),
-            pos3=to_pos_section(pos_parts[_POS_INDEX_FOURTH]),
-            normalized_form=parts[2],
-            dictionary_form=parts[3],
-            reading=reading,
+    def __init__(
+        self,
+        text: str = "",
+        part_of_speech: PartOfSpeech = PartOfSpeech.Unknown,
+        pos1: PartOfSpeechSection = PartOfSpeechSection.None_,
+        pos2: PartOfSpeechSection = PartOfSpeechSection.None_,
+        pos3: PartOfSpeechSection = PartOfSpeechSection.None_,
+        normalized_form: str = "",
+        dictionary_form: str = "",
+        reading: str = "",
+        is_invalid: bool = False,
+    ) -> None:
+        self.text = text
+        self.part_of_speech = part_of_speech
+        self._pos1 = pos1
+        self._pos2 = pos2
+        self._pos3 = pos3
+        self.normalized_form = normalized_form
+        self.dictionary_form = dictionary_form
+        self.reading = reading
+        self.is_invalid = is_invalid
+        self.sections_mask = (1 << pos1) | (1 << pos2) | (1 << pos3)
+
+    def _fields(self) -> tuple[object, ...]:
+        return (
+            self.text,
+            self.part_of_speech,
+            self._pos1,
+            self._pos2,
+            self._pos3,
+            self.normalized_form,
+            self.dictionary_form,
+            self.reading,
+            self.is_invalid,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(text={self.text!r}, part_of_speech={self.part_of_speech!r}, "
+            f"pos1={self._pos1!r}, pos2={self._pos2!r}, pos3={self._pos3!r}, "
+            f"normalized_form={self.normalized_form!r}, dictionary_form={self.dictionary_form!r}, "
+            f"reading={self.reading!r}, is_invalid={self.is_invalid!r})"
         )
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WordInfo) or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    # Mutable and compared by value, so unhashable (as the dataclass was)
+    __hash__ = None
+
+    def __copy__(self) -> WordInfo:
+        # The default copy protocol goes through __reduce_ex__, which is far
+        # slower than calling __init__ for a slotted class
+        return self.__class__(*self._fields())
+
+    @property
+    def pos1(self) -> PartOfSpeechSection:
+        return self._pos1
+
+    @pos1.setter
+    def pos1(self, value: PartOfSpeechSection) -> None:
+        self._pos1 = value
+        self._update_sections_mask()
+
+    @property
+    def pos2(self) -> PartOfSpeechSection:
+        return self._pos2
+
+    @pos2.setter
+    def pos2(self, value: PartOfSpeechSection) -> None:
+        self._pos2 = value
+        self._update_sections_mask()
+
+    @property
+    def pos3(self) -> PartOfSpeechSection:
+        return self._pos3
+
+    @pos3.setter
+    def pos3(self, value: PartOfSpeechSection) -> None:
+        self._pos3 = value
+        self._update_sections_mask()
+
     @classmethod
     def from_fields(
         cls,
@@ -59,15 +162,36 @@ class WordInfo:
         p2 = to_pos_section(pos[_POS_INDEX_THIRD]) if len(pos) > _POS_INDEX_THIRD else PartOfSpeechSection.None_
         p3 = to_pos_section(pos[_POS_INDEX_FOURTH]) if len(pos) > _POS_INDEX_FOURTH else PartOfSpeechSection.None_
         return cls(
-            text=surface,
+            text=intern(surface),
             part_of_speech=p0,
             pos1=p1,
             pos2=p2,
             pos3=p3,
-            normalized_form=normalized,
-            dictionary_form=dictionary,
-            reading=reading,
+            normalized_form=intern(normalized),
+            dictionary_form=intern(dictionary),
+            reading=intern(reading),
         )
 
+    def _update_sections_mask(self) -> None:
+        self.sections_mask = (1 << self._pos1) | (1 << self._pos2) | (1 << self._pos3)
+
     def has_section(self, s: PartOfSpeechSection) -> bool:
-        return s in {self.pos1, self.pos2, self.pos3}
+        # Three short-circuiting compares; no set is built per call
+        return s == self._pos1 or s == self._pos2 or s == self._pos3
+
+
+def parse_sudachi_output(out: str) -> list[WordInfo]:
+    """Valid WordInfos for all morpheme lines of Sudachi's output.
+
+    Lines with fewer than six columns ("EOS", blanks) or a POS column with
+    fewer than four parts are skipped.
+    """
+    wis: list[WordInfo] = []
+    for surface, pos_field, normalized, dictionary, reading in _SUDACHI_LINE_RE.findall(out):
+        pos = _parse_pos_field(pos_field)
+        if pos is None:
+            continue
+        # Positional in field order (text, part_of_speech, pos1..pos3, normalized_form,
+        # dictionary_form, reading): binding eight keywords per morpheme is measurable here
+        wis.append(WordInfo(intern(surface), *pos, intern(normalized), intern(dictionary), intern(reading)))
+    return wis
@@ -1,19 +1,51 @@
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import dataclass
+import re
+import sys
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeconjugationForm:
     text: str
     original_text: str
     tags: tuple[str, ...]
-    seen_text: frozenset[str]
+    # Sorted, so that forms that saw the same texts compare equal
+    seen_text: tuple[str, ...]
     process: tuple[str, ...]
 
 
+# Whole-line // comments in the rules file
+_COMMENT_LINE_RE = re.compile(r"^\s*//.*$", re.MULTILINE)
+
+# Rule types that go through _std_rule and so need the text to end with con_end
+_SUFFIX_RULE_TYPES = frozenset({"stdrule", "rewriterule", "onlyfinalrule", "neverfinalrule", "contextrule"})
+
+
+def _add_seen(form: DeconjugationForm, new_text: str) -> tuple[str, ...]:
+    # seen_text holds a handful of entries: insert into the sorted tuple
+    # rather than copying through a set
+    seen = form.seen_text or (form.text,)
+    i = bisect_left(seen, new_text)
+    if i < len(seen) and seen[i] == new_text:
+        return seen
+    return seen[:i] + (new_text,) + seen[i:]
+
+
+def _intern_tags(values: list[str] | None) -> list[str] | None:
+    # Rule strings are compared on every rule application; interned copies compare by identity
+    return None if values is None else [sys.intern(v) for v in values]
+
+
+# (dec_end, con_end, len(con_end), dec_tag, con_tag)
+_Variant = tuple[str, str, int, str | None, str | None]
+
+
 @dataclass
 class Rule:
     type: str
@@ -23,62 +55,106 @@ class Rule:
     dec_tag: list[str] | None
     con_tag: list[str] | None
     detail: str
+    # One variant per entry of dec_end; a shorter list falls back to its
+    # first item, as in JL
+    variants: list[_Variant] = field(init=False, repr=False, compare=False)
+    # The variants that can match a text ending in a given character. Variants
+    # with an empty con_end match any text and sit in every list, and alone in
+    # suffix_free_variants for characters that have no list.
+    variants_by_last_char: dict[str, list[_Variant]] = field(init=False, repr=False, compare=False)
+    suffix_free_variants: list[_Variant] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        dec_end, con_end, dec_tag, con_tag = self.dec_end, self.con_end, self.dec_tag, self.con_tag
+        self.variants = []
+        for i, dec in enumerate(dec_end):
+            con = con_end[i] if i < len(con_end) else con_end[0]
+            self.variants.append(
+                (
+                    dec,
+                    con,
+                    len(con),
+                    (dec_tag[i] if i < len(dec_tag) else dec_tag[0]) if dec_tag else None,
+                    (con_tag[i] if i < len(con_tag) else con_tag[0]) if con_tag else None,
+                )
+            )
+        self.suffix_free_variants = [v for v in self.variants if not v[1]]
+        last_chars = {v[1][-1] for v in self.variants if v[1]}
+        self.variants_by_last_char = {c: [v for v in self.variants if not v[1] or v[1].endswith(c)] for c in last_chars}
 
 
 class Deconjugator:
     def __init__(self, rules_path: Path) -> None:
         txt = rules_path.read_text(encoding="utf-8")
         # Allow // comments
-        lines = []
-        for line in txt.splitlines():
-            ls = line.lstrip()
-            if ls.startswith("//"):
-                continue
-            lines.append(line)
-        raw = json.loads("\n".join(lines))
+        raw = json.loads(_COMMENT_LINE_RE.sub("", txt))
         self.rules: list[Rule] = []
         for r in raw:
             self.rules.append(
                 Rule(
                     type=r["type"],
                     context_rule=r.get("contextrule"),
-                    dec_end=r["dec_end"],
-                    con_end=r["con_end"],
-                    dec_tag=r.get("dec_tag"),
-                    con_tag=r.get("con_tag"),
-                    detail=r.get("detail", ""),
+                    dec_end=[sys.intern(v) for v in r["dec_end"]],
+                    con_end=[sys.intern(v) for v in r["con_end"]],
+                    dec_tag=_intern_tags(r.get("dec_tag")),
+                    con_tag=_intern_tags(r.get("con_tag")),
+                    detail=sys.intern(r.get("detail", "")),
                 )
             )
+        # A std-family rule only fires when the text ends with one of its
+        # con_end values, so rules are grouped by the last character of those.
+        # Rules with an empty con_end are tried on every form. Each bucket
+        # keeps the original rule order. Substitutions need a form with no
+        # process yet, which only the starting form has, so they are kept apart.
+        self._substitution_rules = [r for r in self.rules if r.type == "substitution"]
+        suffix_rules = [r for r in self.rules if r.type in _SUFFIX_RULE_TYPES]
+        always = [r for r in suffix_rules if not all(r.con_end)]
+        last_chars = {ce[-1] for r in suffix_rules for ce in r.con_end if ce}
+        self._always_rules: list[Rule] = always
+        self._rules_by_last_char: dict[str, list[Rule]] = {
+            c: [r for r in suffix_rules if r in always or any(ce.endswith(c) for ce in r.con_end)] for c in last_chars
+        }
+        # Common words are deconjugated over and over; results depend on the text alone
+        self._deconjugate_cached = functools.lru_cache(maxsize=4096)(self._deconjugate)
 
     def deconjugate(self, text: str) -> set[DeconjugationForm]:
-        processed: set[DeconjugationForm] = set()
+        # A fresh set, as before memoization, so callers may still modify it.
+        # ParserPort caches its sorted forms per surface, so this copy is paid
+        # once per distinct surface there
+        return set(self._deconjugate_cached(text))
+
+    def _deconjugate(self, text: str) -> frozenset[DeconjugationForm]:
         if not text:
-            return processed
-        novel: set[DeconjugationForm] = {
-            DeconjugationForm(text=text, original_text=text, tags=(), seen_text=frozenset(), process=())
-        }
-        rules = self.rules
-        while novel:
-            new_novel: set[DeconjugationForm] = set()
-            for form in novel:
-                if self._skip(form):
+            return frozenset()
+        start = DeconjugationForm(text=text, original_text=text, tags=(), seen_text=(), process=())
+        # Every form ever produced goes into seen (the result) exactly once and
+        # is queued for expansion at that point
+        seen: set[DeconjugationForm] = {start}
+        queue = deque((start,))
+        for rule in self._substitution_rules:
+            for f in self._substitution(start, rule) or ():
+                if f not in seen:
+                    seen.add(f)
+                    queue.append(f)
+        rules_by_last_char = self._rules_by_last_char
+        always = self._always_rules
+        # Forms that grew too far past the original are not expanded further
+        max_text_len = len(text) + 10
+        max_tags = len(text) + 6
+        while queue:
+            form = queue.popleft()
+            form_text = form.text
+            if not form_text or len(form_text) > max_text_len or len(form.tags) > max_tags:
+                continue
+            for rule in rules_by_last_char.get(form_text[-1], always):
+                out = self._apply_rule(form, rule)
+                if not out:
                     continue
-                for rule in rules:
-                    out = self._apply_rule(form, rule)
-                    if not out:
-                        continue
-                    for f in out:
-                        if f not in processed and f not in novel and f not in new_novel:
-                            new_novel.add(f)
-            processed |= novel
-            novel = new_novel
-        return processed
-
-    @staticmethod
-    def _skip(form: DeconjugationForm) -> bool:
-        return (
-            (not form.text) or (len(form.text) > len(form.original_text) + 10) or (len(form.tags) > len(form.original_text) + 6)
-        )
+                for f in out:
+                    if f not in seen:
+                        seen.add(f)
+                        queue.append(f)
+        return frozenset(seen)
 
     def _apply_rule(self, form: DeconjugationForm, rule: Rule) -> set[DeconjugationForm] | None:
         t = rule.type
@@ -99,65 +175,32 @@ class Deconjugator:
     def _std_rule(self, form: DeconjugationForm, rule: Rule) -> set[DeconjugationForm] | None:
         if (not rule.detail) and len(form.tags) == 0:
             return None
-        outs: set[DeconjugationForm] = set()
-
-        def try_one(dec_end: str, con_end: str, dec_tag: str | None, con_tag: str | None) -> None:
-            if not form.text.endswith(con_end):
-                return
-            if form.tags and (form.tags[-1] != con_tag):
-                return
-            prefix = form.text[: len(form.text) - len(con_end)]
-            new_text = prefix + dec_end
+        text = form.text
+        tags = form.tags
+        outs: set[DeconjugationForm] | None = None
+        variants = rule.variants_by_last_char.get(text[-1:], rule.suffix_free_variants)
+        for dec_end, con_end, con_end_len, dec_tag, con_tag in variants:
+            if not text.endswith(con_end):
+                continue
+            if tags and (tags[-1] != con_tag):
+                continue
+            new_text = text[: len(text) - con_end_len] + dec_end
             if new_text == form.original_text:
-                return
+                continue
             nf = self._create_new_form(form, new_text, con_tag, dec_tag, rule.detail)
-            outs.add(nf)
-
-        if len(rule.dec_end) == 1:
-            try_one(
-                rule.dec_end[0],
-                rule.con_end[0],
-                rule.dec_tag[0] if rule.dec_tag else None,
-                rule.con_tag[0] if rule.con_tag else None,
-            )
-        else:
-            for i in range(len(rule.dec_end)):
-                try_one(
-                    rule.dec_end[i] if i < len(rule.dec_end) else rule.dec_end[0],
-                    rule.con_end[i] if i < len(rule.con_end) else rule.con_end[0],
-                    (
-                        rule.dec_tag[i]
-                        if (rule.dec_tag and i < len(rule.dec_tag))
-                        else (rule.dec_tag[0] if rule.dec_tag else None)
-                    ),
-                    (
-                        rule.con_tag[i]
-                        if (rule.con_tag and i < len(rule.con_tag))
-                        else (rule.con_tag[0] if rule.con_tag else None)
-                    ),
-                )
-        return outs or None
+            if outs is None:
+                outs = {nf}
+            else:
+                outs.add(nf)
+        return outs
 
     def _substitution(self, form: DeconjugationForm, rule: Rule) -> set[DeconjugationForm] | None:
         if form.process or not form.text:
             return None
         outs: set[DeconjugationForm] = set()
-
-        def apply(con_end: str, dec_end: str):
-            if con_end not in form.text:
-                return
-            new_text = form.text.replace(con_end, dec_end)
-            nf = self._create_substitution_form(form, new_text, rule.detail)
-            outs.add(nf)
-
-        if len(rule.dec_end) == 1:
-            apply(rule.con_end[0], rule.dec_end[0])
-        else:
-            for i in range(len(rule.dec_end)):
-                apply(
-                    rule.con_end[i] if i < len(rule.con_end) else rule.con_end[0],
-                    rule.dec_end[i] if i < len(rule.dec_end) else rule.dec_end[0],
-                )
+        for dec_end, con_end, _con_end_len, _dec_tag, _con_tag in rule.variants:
+            if con_end in form.text:
+                outs.add(self._create_substitution_form(form, form.text.replace(con_end, dec_end), rule.detail))
         return outs or None
 
     def _rewrite_rule(self, form: DeconjugationForm, rule: Rule) -> set[DeconjugationForm] | None:
@@ -193,29 +236,25 @@ class Deconjugator:
     def _create_new_form(
         form: DeconjugationForm, new_text: str, con_tag: str | None, dec_tag: str | None, detail: str
     ) -> DeconjugationForm:
-        tags = list(form.tags)
+        tags = form.tags
         if not tags and con_tag is not None:
-            tags.append(con_tag)
+            tags = (con_tag,)
         if dec_tag is not None:
-            tags.append(dec_tag)
-        seen = set(form.seen_text)
-        if not seen:
-            seen.add(form.text)
-        seen.add(new_text)
-        process = list(form.process)
-        process.append(detail)
+            tags += (dec_tag,)
         return DeconjugationForm(
-            text=new_text, original_text=form.original_text, tags=tuple(tags), seen_text=frozenset(seen), process=tuple(process)
+            text=new_text,
+            original_text=form.original_text,
+            tags=tags,
+            seen_text=_add_seen(form, new_text),
+            process=form.process + (detail,),
         )
 
     @staticmethod
     def _create_substitution_form(form: DeconjugationForm, new_text: str, detail: str) -> DeconjugationForm:
-        seen = set(form.seen_text)
-        if not seen:
-            seen.add(form.text)
-        seen.add(new_text)
-        process = list(form.process)
-        process.append(detail)
         return DeconjugationForm(
-            text=new_text, original_text=form.original_text, tags=form.tags, seen_text=frozenset(seen), process=tuple(process)
+            text=new_text,
+            original_text=form.original_text,
+            tags=form.tags,
+            seen_text=_add_seen(form, new_text),
+            process=form.process + (detail,),
         )
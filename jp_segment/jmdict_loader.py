@@ -1,9 +1,24 @@
 from __future__ import annotations
 
-import json
+import gc
+import hashlib
+import os
+import pickle
+import re
 import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
+from sys import intern
+
+from ._types import to_part_of_speech
+
+try:
+    # Optional: orjson decodes the term banks several times faster than json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 _ASCII_DIGIT_START = 0x30
 _ASCII_DIGIT_END = 0x39
@@ -25,6 +40,20 @@ _PROLONGED_SOUND_MARK = 0x30FC
 _TERM_ROW_MIN_LENGTH = 7
 _PRIORITY_FIELD_INDEX = 7
 _DEFINITION_FIELD_INDEX = 5
+_SEQUENCE_FIELD_INDEX = 6
+# Longer terms are mostly unique phrases that interning would not share
+_INTERN_MAX_LENGTH = 16
+
+# JmWord.priority_bits flags
+_PRI_JITEN = 1 << 0
+_PRI_ICHI1 = 1 << 1
+_PRI_ICHI2 = 1 << 2
+_PRI_NEWS1 = 1 << 3
+_PRI_NEWS2 = 1 << 4
+_PRI_GAI = 1 << 5
+_PRI_SPEC1 = 1 << 6
+_PRI_SPEC2 = 1 << 7
+_PRI_UK = 1 << 8
 
 
 def _is_katakana(ch: str) -> bool:
@@ -32,15 +61,18 @@ def _is_katakana(ch: str) -> bool:
     return (_KATAKANA_START <= code <= _KATAKANA_END) or code == _PROLONGED_SOUND_MARK
 
 
-def _katakana_to_hiragana(s: str) -> str:
-    out = []
-    for ch in s:
-        code = ord(ch)
-        if _KATAKANA_SMALL_START <= code <= _KATAKANA_SMALL_END:
-            out.append(chr(code - 0x60))
-        else:
-            out.append(ch)
-    return "".join(out)
+# str.translate tables for the kana and width conversions below
+_KATAKANA_TO_HIRAGANA = {cp: cp - 0x60 for cp in range(_KATAKANA_SMALL_START, _KATAKANA_SMALL_END + 1)}
+# Also folds the small wa (ゎ/ヮ) into わ
+_TO_HIRAGANA = {**_KATAKANA_TO_HIRAGANA, ord("ゎ"): ord("わ"), ord("ヮ"): ord("わ")}
+_TO_FULLWIDTH_ASCII = {
+    **{o: _FULLWIDTH_DIGIT_START + (o - _ASCII_DIGIT_START) for o in range(_ASCII_DIGIT_START, _ASCII_DIGIT_END + 1)},
+    **{o: _FULLWIDTH_UPPER_START + (o - _ASCII_UPPER_START) for o in range(_ASCII_UPPER_START, _ASCII_UPPER_END + 1)},
+    **{o: _FULLWIDTH_LOWER_START + (o - _ASCII_LOWER_START) for o in range(_ASCII_LOWER_START, _ASCII_LOWER_END + 1)},
+}
+_TO_HALFWIDTH_ASCII = {fw: ascii_ for ascii_, fw in _TO_FULLWIDTH_ASCII.items()}
+_ANY_WIDTH_ALNUM_RE = re.compile("[0-9A-Za-z０-９Ａ-Ｚａ-ｚ]")
+_ASCII_LETTER_RE = re.compile("[A-Za-z]")
 
 
 _HIRA_VOWEL = {
@@ -121,6 +153,8 @@ _HIRA_VOWEL = {
 
 def _expand_long_vowels(hira: str) -> str:
     # Replace long vowel mark 'ー' with previous vowel; basic heuristic
+    if "ー" not in hira:
+        return hira
     out = []
     prev_vowel = ""
     for ch in hira:
@@ -138,7 +172,7 @@ def _expand_long_vowels(hira: str) -> str:
 
 
 def _looks_english(text: str) -> bool:
-    return any(ch.isascii() and ch.isalpha() for ch in text)
+    return _ASCII_LETTER_RE.search(text) is not None
 
 
 def _extract_definitions(raw: object) -> list[str]:
@@ -167,27 +201,19 @@ def _extract_definitions(raw: object) -> list[str]:
                 walk(child, lang)
 
     walk(raw, None)
-    seen: set[str] = set()
-    unique: list[str] = []
-    for text in collected:
-        if text not in seen:
-            seen.add(text)
-            unique.append(text)
-    return unique
+    return list(dict.fromkeys(collected))
 
 
 def to_hiragana_preserve_long(s: str) -> str:
-    s = s.replace("ゎ", "わ").replace("ヮ", "わ")
-    return _katakana_to_hiragana(s)
+    return s.translate(_TO_HIRAGANA)
 
 
 def to_hiragana_expand_long(s: str) -> str:
-    s = s.replace("ゎ", "わ").replace("ヮ", "わ")
-    hira = _katakana_to_hiragana(s)
-    return _expand_long_vowels(hira)
+    return _expand_long_vowels(s.translate(_TO_HIRAGANA))
 
 
-@dataclass
+# One per JMdict/JMnedict sequence (~800k), so no per-instance __dict__
+@dataclass(slots=True)
 class JmWord:
     word_id: int
     readings: set[str] = field(default_factory=set)
@@ -196,52 +222,89 @@ class JmWord:
     priorities: list[str] = field(default_factory=list)
     definitions: list[str] = field(default_factory=list)
 
+    # Flags derived from priorities/parts_of_speech; see update_priority_bits
+    priority_bits: int = field(default=0, repr=False, compare=False)
+    # NN of the first nfNN priority, or -1
+    nf_rank: int = field(default=-1, repr=False, compare=False)
+    # Bit 1 << PartOfSpeech for each of parts_of_speech; see update_pos_mask
+    pos_mask: int = field(default=0, repr=False, compare=False)
+
+    def update_priority_bits(self) -> None:
+        """Recompute priority_bits and nf_rank after changing priorities or parts_of_speech."""
+        bits = 0
+        nf_rank = -1
+        for p in self.priorities:
+            if p == "jiten":
+                bits |= _PRI_JITEN
+            elif p in {"ichi1", "ichi"}:
+                bits |= _PRI_ICHI1
+            elif p == "ichi2":
+                bits |= _PRI_ICHI2
+            elif p in {"gai1", "gai2"}:
+                bits |= _PRI_GAI
+            elif p == "spec1":
+                bits |= _PRI_SPEC1
+            elif p == "spec2":
+                bits |= _PRI_SPEC2
+            elif p.startswith("news1"):
+                bits |= _PRI_NEWS1
+            elif p.startswith("news2"):
+                bits |= _PRI_NEWS2
+            elif nf_rank < 0 and p.startswith("nf") and p[2:].isdigit():
+                nf_rank = int(p[2:])
+        if "uk" in self.parts_of_speech:
+            bits |= _PRI_UK
+        self.priority_bits = bits
+        self.nf_rank = nf_rank
+
+    def update_pos_mask(self) -> None:
+        """Recompute pos_mask after changing parts_of_speech."""
+        mask = 0
+        for tag in self.parts_of_speech:
+            mask |= 1 << to_part_of_speech(tag)
+        self.pos_mask = mask
+
     def get_priority_score(self, *, is_kana: bool) -> int:
         """Port of Jiten's GetPriorityScore with approximations for Yomitan tags.
 
         - Recognizes: jiten, ichi(=ichi1), ichi1, ichi2, news1*, news2*, gai1/2, nfNN, spec1/2
         - Applies kana bias for 'uk'.
         """
-        pr = self.priorities or []
-        if not pr:
-            pr = []
+        bits = self.priority_bits
         score = 0
 
         # Highest explicit override
-        if any(p == "jiten" for p in pr):
+        if bits & _PRI_JITEN:
             score += 100
 
         # Ichi
-        if any(p in {"ichi1", "ichi"} for p in pr):
+        if bits & _PRI_ICHI1:
             score += 20
-        elif any(p == "ichi2" for p in pr):
+        elif bits & _PRI_ICHI2:
             score += 10
 
         # News; Yomitan encodes as news1k/news2k; accept prefix
-        if any(p.startswith("news1") for p in pr):
+        if bits & _PRI_NEWS1:
             score += 15
-        if any(p.startswith("news2") for p in pr):
+        if bits & _PRI_NEWS2:
             score += 10
 
         # Gai1/2
-        if any(p in {"gai1", "gai2"} for p in pr):
+        if bits & _PRI_GAI:
             score += 5
 
         # nfXX
-        for p in pr:
-            if p.startswith("nf") and p[2:].isdigit():
-                nf_rank = int(p[2:])
-                score += max(0, 5 - round(nf_rank / 10.0))
-                break
+        if self.nf_rank >= 0:
+            score += max(0, 5 - round(self.nf_rank / 10.0))
 
         if score == 0:
-            if any(p == "spec1" for p in pr):
+            if bits & _PRI_SPEC1:
                 score += 15
-            elif any(p == "spec2" for p in pr):
+            elif bits & _PRI_SPEC2:
                 score += 5
 
         # Kana bias for 'uk' (usually kana-only)
-        if "uk" in self.parts_of_speech:
+        if bits & _PRI_UK:
             score += 10 if is_kana else -10
 
         return score
@@ -255,6 +318,13 @@ class JmDict:
 
 _CACHE: dict[tuple[Path, ...], JmDict] = {}
 
+# Built dictionaries are also pickled (~150 MB) next to the archives, in the
+# package's resources/jmdict directory. The cache key only covers the archives
+# and this version, so it MUST be bumped by hand whenever JmWord/JmDict, the
+# build steps or the JMdict tag mapping change; otherwise stale pickles load.
+_DISK_CACHE_VERSION = 5
+_DISK_CACHE_PREFIX = ".jmdict_cache_"
+
 
 def load_jmdict(primary_zip: Path) -> JmDict:
     # Discover all JMdict/JMnedict zips in jmdict folder
@@ -266,6 +336,17 @@ def load_jmdict(primary_zip: Path) -> JmDict:
     if cache_key in _CACHE:
         return _CACHE[cache_key]
 
+    disk_cache = _disk_cache_path(zips)
+    jd = _read_disk_cache(disk_cache)
+    if jd is None:
+        with _gc_paused():
+            jd = _build_jmdict(zips)
+        _write_disk_cache(disk_cache, jd)
+    _CACHE[cache_key] = jd
+    return jd
+
+
+def _build_jmdict(zips: list[Path]) -> JmDict:
     words: dict[int, JmWord] = {}
     lookups: dict[str, list[int]] = {}
 
@@ -274,52 +355,53 @@ def load_jmdict(primary_zip: Path) -> JmDict:
             for name in z.namelist():
                 if not name.endswith(".json") or not name.startswith("term_bank_"):
                     continue
-                data = json.loads(z.read(name))
+                data = _json_loads(z.read(name))
                 for row in data:
-                    if not isinstance(row, list) or len(row) < _TERM_ROW_MIN_LENGTH:
+                    # The decoder only produces exact list/int/str, so plain type
+                    # checks are enough (and cheaper than isinstance)
+                    if type(row) is not list or len(row) < _TERM_ROW_MIN_LENGTH:
                         continue
-                    term = row[0] or ""
-                    reading = row[1] or ""
-                    pos_str = row[2] or ""
-                    seq = row[6] if isinstance(row[6], int) else None
-                    if seq is None:
+                    seq = row[_SEQUENCE_FIELD_INDEX]
+                    if type(seq) is not int:
                         continue
+                    term = row[0]
+                    reading = row[1]
+                    pos_str = row[2]
                     w = words.get(seq)
                     if w is None:
                         w = JmWord(word_id=seq)
                         words[seq] = w
                     if reading:
-                        w.readings.add(reading)
+                        w.readings.add(_intern_short(reading))
                     if term:
+                        term = _intern_short(term)
                         w.spellings.add(term)
                         # In Jiten DB, spellings are also included in the Readings list
                         w.readings.add(term)
-                    for tag in pos_str.split():
-                        if tag and tag not in w.parts_of_speech:
-                            w.parts_of_speech.append(tag)
+                    if pos_str:
+                        parts_of_speech = w.parts_of_speech
+                        for tag in pos_str.split():
+                            if tag not in parts_of_speech:
+                                parts_of_speech.append(intern(tag))
                     # Priorities/tags are in optional field 7 as a space-separated string
-                    if (
-                        len(row) > _PRIORITY_FIELD_INDEX
-                        and isinstance(row[_PRIORITY_FIELD_INDEX], str)
-                        and row[_PRIORITY_FIELD_INDEX]
-                    ):
-                        raw = row[_PRIORITY_FIELD_INDEX].strip()
-                        # strip decorations like stars
-                        raw = raw.replace("⭐", "").strip()
-                        for tok in raw.split():
-                            t = tok.strip()
-                            if not t:
-                                continue
-                            # normalize some variants present in Yomitan
-                            if t == "ichi":
-                                t = "ichi1"
-                            if t not in w.priorities:
-                                w.priorities.append(t)
+                    if len(row) > _PRIORITY_FIELD_INDEX:
+                        raw = row[_PRIORITY_FIELD_INDEX]
+                        if type(raw) is str and raw:
+                            priorities = w.priorities
+                            # strip decorations like stars
+                            for t in raw.replace("⭐", "").split():
+                                # normalize some variants present in Yomitan
+                                if t == "ichi":
+                                    t = "ichi1"
+                                if t not in priorities:
+                                    priorities.append(intern(t))
                     # Definitions/glosses field (structured content)
-                    if len(row) > _DEFINITION_FIELD_INDEX and row[_DEFINITION_FIELD_INDEX]:
-                        for definition in _extract_definitions(row[_DEFINITION_FIELD_INDEX]):
-                            if definition not in w.definitions:
-                                w.definitions.append(definition)
+                    glossary = row[_DEFINITION_FIELD_INDEX]
+                    if glossary:
+                        definitions = w.definitions
+                        for definition in _extract_definitions(glossary):
+                            if definition not in definitions:
+                                definitions.append(definition)
 
     for z in zips:
         ingest_zip(z)
@@ -327,44 +409,102 @@ def load_jmdict(primary_zip: Path) -> JmDict:
     # Inject Jiten's hardcoded custom words
     _inject_custom_words(words)
 
-    # Build lookup table
+    for w in words.values():
+        w.update_priority_bits()
+        w.update_pos_mask()
+
+    # Build lookup table; readings are shared by many words, so each distinct
+    # one is normalized once
+    reading_keys: dict[str, tuple[str, ...]] = {}
     for word_id, w in words.items():
         # spellings as-is
         for s in w.spellings:
             _lk_add(lookups, s, word_id)
             # width variants for ascii/digits
-            hw = _to_halfwidth_ascii(s)
-            fw = _to_fullwidth_ascii(s)
-            if hw != s:
-                _lk_add(lookups, hw, word_id)
-            if fw != s:
-                _lk_add(lookups, fw, word_id)
+            for v in _width_variants(s):
+                _lk_add(lookups, v, word_id)
         # readings variants
         for r in w.readings:
-            key1 = to_hiragana_preserve_long(r)
-            key2 = to_hiragana_expand_long(r)
-            _lk_add(lookups, key1, word_id)
-            if key2 != key1:
-                _lk_add(lookups, key2, word_id)
-            if all(_is_katakana(ch) for ch in r):
-                _lk_add(lookups, r, word_id)
-            # also add width-normalized forms for ascii/digits that appear as readings
-            hw = _to_halfwidth_ascii(r)
-            fw = _to_fullwidth_ascii(r)
-            if hw != r:
-                _lk_add(lookups, hw, word_id)
-            if fw != r:
-                _lk_add(lookups, fw, word_id)
-
-    jd = JmDict(lookups=lookups, words=words)
-    _CACHE[cache_key] = jd
-    return jd
+            keys = reading_keys.get(r)
+            if keys is None:
+                keys = reading_keys[r] = _reading_lookup_keys(r)
+            for key in keys:
+                _lk_add(lookups, key, word_id)
+
+    return JmDict(lookups=lookups, words=words)
+
+
+def _reading_lookup_keys(r: str) -> tuple[str, ...]:
+    key1 = to_hiragana_preserve_long(r)
+    key2 = _expand_long_vowels(key1)
+    keys = [key1]
+    if key2 != key1:
+        keys.append(key2)
+    if all(_is_katakana(ch) for ch in r):
+        keys.append(r)
+    # also add width-normalized forms for ascii/digits that appear as readings
+    keys.extend(_width_variants(r))
+    return tuple(keys)
+
+
+def _disk_cache_path(zips: list[Path]) -> Path:
+    # Keyed on the archives' names, sizes and mtimes plus the cache format
+    h = hashlib.sha256(str(_DISK_CACHE_VERSION).encode())
+    for p in zips:
+        st = p.stat()
+        h.update(f"\0{p.name}\0{st.st_size}\0{st.st_mtime_ns}".encode())
+    return zips[0].parent / f"{_DISK_CACHE_PREFIX}{h.hexdigest()[:16]}.pkl"
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Millions of new containers keep triggering the cyclic GC, which would
+    # more than double the time spent; none of them form cycles worth collecting
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _read_disk_cache(path: Path) -> JmDict | None:
+    try:
+        with path.open("rb") as f, _gc_paused():
+            jd = pickle.load(f)
+    except Exception:
+        # Missing, corrupt or written by an incompatible version: rebuild
+        return None
+    return jd if isinstance(jd, JmDict) else None
+
+
+def _write_disk_cache(path: Path, jd: JmDict) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            pickle.dump(jd, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        for stale in path.parent.glob(f"{_DISK_CACHE_PREFIX}*.pkl"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        # Read-only install or full disk: the cache is only an optimization
+        tmp.unlink(missing_ok=True)
+
+
+def _intern_short(s: str) -> str:
+    # Terms recur across entries, term banks and lookup keys; sharing one
+    # object per string shrinks the built (and unpickled) dictionary
+    return intern(s) if len(s) <= _INTERN_MAX_LENGTH else s
 
 
 def _lk_add(lookups: dict[str, list[int]], key: str, word_id: int) -> None:
+    # All keys of one word are added back to back, so comparing against the
+    # tail is enough to keep each list free of duplicates
     arr = lookups.get(key)
     if arr is None:
-        lookups[key] = [word_id]
+        lookups[_intern_short(key)] = [word_id]
     elif not arr or arr[-1] != word_id:
         arr.append(word_id)
 
@@ -393,32 +533,15 @@ def _inject_custom_words(words: dict[int, JmWord]) -> None:
     words[w.word_id] = w
 
 
-def _to_fullwidth_ascii(s: str) -> str:
-    # Only transform ASCII letters and digits to fullwidth
-    out = []
-    for ch in s:
-        o = ord(ch)
-        if _ASCII_DIGIT_START <= o <= _ASCII_DIGIT_END:
-            out.append(chr(_FULLWIDTH_DIGIT_START + (o - _ASCII_DIGIT_START)))
-        elif _ASCII_UPPER_START <= o <= _ASCII_UPPER_END:
-            out.append(chr(_FULLWIDTH_UPPER_START + (o - _ASCII_UPPER_START)))
-        elif _ASCII_LOWER_START <= o <= _ASCII_LOWER_END:
-            out.append(chr(_FULLWIDTH_LOWER_START + (o - _ASCII_LOWER_START)))
-        else:
-            out.append(ch)
-    return "".join(out)
-
-
-def _to_halfwidth_ascii(s: str) -> str:
-    out = []
-    for ch in s:
-        o = ord(ch)
-        if _FULLWIDTH_DIGIT_START <= o <= _FULLWIDTH_DIGIT_END:
-            out.append(chr(_ASCII_DIGIT_START + (o - _FULLWIDTH_DIGIT_START)))
-        elif _FULLWIDTH_UPPER_START <= o <= _FULLWIDTH_UPPER_END:
-            out.append(chr(_ASCII_UPPER_START + (o - _FULLWIDTH_UPPER_START)))
-        elif _FULLWIDTH_LOWER_START <= o <= _FULLWIDTH_LOWER_END:
-            out.append(chr(_ASCII_LOWER_START + (o - _FULLWIDTH_LOWER_START)))
-        else:
-            out.append(ch)
-    return "".join(out)
+def _width_variants(s: str) -> tuple[str, ...]:
+    """Halfwidth and fullwidth forms of s's letters and digits that differ from s."""
+    # One scan rejects the pure kana/kanji terms, nearly all of them
+    if _ANY_WIDTH_ALNUM_RE.search(s) is None:
+        return ()
+    hw = s.translate(_TO_HALFWIDTH_ASCII)
+    fw = s.translate(_TO_FULLWIDTH_ASCII)
+    if hw == s:
+        return (fw,)
+    if fw == s:
+        return (hw,)
+    return (hw, fw)
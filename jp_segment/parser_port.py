@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import functools
 import importlib
 import os
 import re
@@ -7,10 +9,10 @@ import sys
 from dataclasses import dataclass
 
 from ._analyzer import apply_pipeline, preprocess_text
-from ._types import PartOfSpeech, PartOfSpeechSection, to_part_of_speech
+from ._types import PartOfSpeech, PartOfSpeechSection
 from ._utils import find_resources_dir
 from ._wordinfo import WordInfo
-from .deconjugator import Deconjugator
+from .deconjugator import DeconjugationForm, Deconjugator
 from .jmdict_loader import JmDict, JmWord, load_jmdict, to_hiragana_expand_long, to_hiragana_preserve_long
 from .segmenter import Segmenter
 
@@ -19,18 +21,24 @@ _CLEAN_RE = re.compile(
     r"\uFF10-\uFF19\u3005\uFF0E]"
 )
 
-_FULLWIDTH_LOWER_A = "\uff41"
-_FULLWIDTH_LOWER_Z = "\uff5a"
-_FULLWIDTH_UPPER_A = "\uff21"
-_FULLWIDTH_UPPER_Z = "\uff3a"
-_HIRAGANA_OR_KATAKANA_START = 0x3040
-_HIRAGANA_OR_KATAKANA_END = 0x30FF
-_LONG_VOWEL_MARK = 0x30FC
+_ASCII_OR_FULLWIDTH_LETTERS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    + "".join(chr(c) for c in range(0xFF21, 0xFF3B))  # Ａ-Ｚ
+    + "".join(chr(c) for c in range(0xFF41, 0xFF5B))  # ａ-ｚ
+)
+# Hiragana and katakana blocks (the long vowel mark U+30FC included)
+_KANA_ONLY_RE = re.compile(r"[\u3040-\u30FF]*")
 _MAX_DECONJ_ATTEMPTS = 3
 _MIN_TRIM_LENGTH = 2
 _READING_FORM_INDEX = 4
 
 
+# Morpheme surfaces repeat heavily, so the cleanup is cached per surface
+@functools.lru_cache(maxsize=4096)
+def _clean_token_text(text: str) -> str:
+    return _CLEAN_RE.sub("", text).replace("ッー", "")
+
+
 @dataclass
 class DeckWord:
     word_id: int
@@ -60,6 +68,10 @@ class ParserPort:
         self._dbg_exact: str | None = os.getenv("JP_SEGMENT_DEBUG_EXACT")
         self._dbg_contains: str | None = os.getenv("JP_SEGMENT_DEBUG_CONTAINS")
         self._dbg_context: str | None = None
+        # Surfaces repeat throughout a text; the sorted forms depend on the surface alone
+        self._sorted_forms_cached = functools.lru_cache(maxsize=16384)(self._sorted_forms)
+        # Likewise for the reading index of a matched entry (readings are fixed once loaded)
+        self._reading_index_cached = functools.lru_cache(maxsize=16384)(self._reading_index)
 
     # --- debug helpers ---
     def _should_dbg(self, text: str) -> bool:
@@ -74,34 +86,40 @@ class ParserPort:
             print("[JP-SEGMENT DEBUG]", *args, file=sys.stderr)
 
     def parse_text_tokens(self, text: str) -> list[str]:
-        # Set debug context
-        self._dbg_context = text
-        if self._should_dbg(text):
-            self._dbg("TEXT:", repr(text))
-
         # Step 1: morphological analysis via Segmenter internals
         seg = self._segmenter
         pre = preprocess_text(text)
-        if self._should_dbg(text):
-            self._dbg("PREPROCESSED:", repr(pre))
         wis = seg._ffi_analyze(pre, morphemes_only=False) if seg._ffi else seg._sudachipy_analyze(pre, morphemes_only=False)
+        return self._tokens_from_morphemes(text, pre, wis)
+
+    def parse_texts_tokens(self, texts: list[str]) -> list[list[str]]:
+        """parse_text_tokens for several texts, sharing one native analysis call."""
+        seg = self._segmenter
+        if not seg._ffi:
+            return [self.parse_text_tokens(text) for text in texts]
+        pres = [preprocess_text(text) for text in texts]
+        wis_per_text = seg._ffi_analyze_many(pres, morphemes_only=False)
+        return [self._tokens_from_morphemes(text, pre, wis) for text, pre, wis in zip(texts, pres, wis_per_text)]
+
+    def _tokens_from_morphemes(self, text: str, pre: str, wis: list[WordInfo]) -> list[str]:
+        # Set debug context; the traces are the same whether the text was analyzed alone or in a batch
+        self._dbg_context = text
         if self._should_dbg(text):
+            self._dbg("TEXT:", repr(text))
+            self._dbg("PREPROCESSED:", repr(pre))
             self._dbg("MORPHS:", [(w.text, w.part_of_speech.name, w.dictionary_form) for w in wis])
         wis = apply_pipeline(wis, morphemes_only=False)
         if self._should_dbg(text):
             self._dbg("POST-PIPELINE:", [(w.text, w.part_of_speech.name, w.dictionary_form) for w in wis])
 
-        # Step 2: clean as in Parser.ParseText
+        # Step 2: clean as in Parser.ParseText. apply_pipeline returned private
+        # copies, so the tokens can be relabelled in place
         cleaned: list[WordInfo] = []
         for w in wis:
-            t = _CLEAN_RE.sub("", w.text)
-            if not t:
-                continue
-            t = t.replace("ッー", "")
+            t = _clean_token_text(w.text)
             if t:
-                nw = WordInfo(**w.__dict__)
-                nw.text = t
-                cleaned.append(nw)
+                w.text = t
+                cleaned.append(w)
         if self._should_dbg(text):
             self._dbg("CLEANED:", [(w.text, w.part_of_speech.name, w.dictionary_form) for w in cleaned])
 
@@ -153,7 +171,7 @@ class ParserPort:
         We also try POS fallbacks (noun⇄verb/adjective).
         """
         # Work on a mutable copy
-        cur = WordInfo(**w.__dict__)
+        cur = copy.copy(w)
 
         def try_process(cur_w: WordInfo) -> DeckWord | None:
             # Primary path chosen by part of speech
@@ -232,29 +250,35 @@ class ParserPort:
         cands = self._jmdict.lookups.get(text, [])
         # try kana-normalized key
         hira = to_hiragana_preserve_long(text)
-        cands_h = self._jmdict.lookups.get(hira, [])
-        if cands_h:
-            # merge de-duped
-            cands = sorted(set(cands) | set(cands_h))
+        if hira == text:
+            # Already kana-normalized; lookup lists never repeat an id
+            if cands:
+                cands = sorted(cands)
+        else:
+            cands_h = self._jmdict.lookups.get(hira, [])
+            if cands_h:
+                # merge de-duped; usually only the kana key is present
+                cands = sorted(set(cands).union(cands_h)) if cands else sorted(cands_h)
         if self._should_dbg(self._dbg_context or ""):
             self._dbg("  candidates(words):", len(cands))
         if not cands:
             return False, None
-        # Fetch words
-        words = {wid: self._jmdict.words[wid] for wid in cands if wid in self._jmdict.words}
-        if self._should_dbg(self._dbg_context or ""):
-            self._dbg("  words-loaded:", len(words))
-        if not words:
-            return False, None
-        # select matches by POS
+        # Fetch words and select matches by POS in one pass
+        words = self._jmdict.words
+        loaded = 0
         matches: list[JmWord] = []
+        pos_bit = 1 << w.part_of_speech
         for wid in cands:
             jw = words.get(wid)
-            if not jw:
+            if jw is None:
                 continue
-            pos = [to_part_of_speech(p) for p in jw.parts_of_speech]
-            if w.part_of_speech in pos:
+            loaded += 1
+            if jw.pos_mask & pos_bit:
                 matches.append(jw)
+        if self._should_dbg(self._dbg_context or ""):
+            self._dbg("  words-loaded:", loaded)
+        if not loaded:
+            return False, None
         if self._should_dbg(self._dbg_context or ""):
             self._dbg("  pos-matches:", len(matches))
         if matches:
@@ -268,17 +292,14 @@ class ParserPort:
             if not jm:
                 return True, None
         # resolve reading index
-        idx = self._compute_reading_index(jm, text)
+        idx = self._reading_index_cached(jm.word_id, text)
         if idx is None:
             return False, None
         # print('DBG noun ok', text, '->', jm.word_id, 'idx', idx)
         return True, DeckWord(word_id=jm.word_id, original_text=w.text, reading_index=idx, parts_of_speech=[w.part_of_speech])
 
     def _deconjugate_verb_or_adjective(self, w: WordInfo) -> tuple[bool, DeckWord | None]:
-        # deconjugate the surface converted to hiragana,
-        # not Sudachi's reading (prevents numbers mapping to unrelated words).
-        hira = to_hiragana_expand_long(w.text)
-        forms = sorted(self._deconjugator.deconjugate(hira), key=lambda f: len(f.text), reverse=True)
+        forms = self._sorted_forms_cached(w.text)
         if self._should_dbg(self._dbg_context or ""):
             self._dbg(" _deconj_verb/adj forms:", [f.text for f in forms[:10]], "(total=", len(forms), ")")
         candidates: list[tuple[str, list[int]]] = []
@@ -302,47 +323,46 @@ class ParserPort:
             return 2
 
         candidates.sort(key=lambda x: lift(x[0]))
-        all_ids: list[int] = []
-        for _, ids in candidates:
-            for i in ids:
-                if i not in all_ids:
-                    all_ids.append(i)
-        words = {wid: self._jmdict.words[wid] for wid in all_ids if wid in self._jmdict.words}
+        words = self._jmdict.words
         matches: list[tuple[JmWord, str]] = []
+        pos_bit = 1 << w.part_of_speech
         for key, ids in candidates:
             for wid in ids:
                 jw = words.get(wid)
-                if not jw:
-                    continue
-                pos = [to_part_of_speech(p) for p in jw.parts_of_speech]
-                if w.part_of_speech in pos:
+                if jw is not None and jw.pos_mask & pos_bit:
                     matches.append((jw, key))
         if not matches:
             return False, None
         best = matches[0]
         if self._should_dbg(self._dbg_context or ""):
             self._dbg("  match: id=", best[0].word_id, "key=", best[1])
-        idx = self._compute_reading_index(best[0], best[1])
+        idx = self._reading_index_cached(best[0].word_id, best[1])
         if idx is None:
             idx = 0
         return True, DeckWord(
             word_id=best[0].word_id, original_text=w.text, reading_index=idx, parts_of_speech=[w.part_of_speech]
         )
 
+    def _sorted_forms(self, surface: str) -> tuple[DeconjugationForm, ...]:
+        # deconjugate the surface converted to hiragana,
+        # not Sudachi's reading (prevents numbers mapping to unrelated words).
+        hira = to_hiragana_expand_long(surface)
+        return tuple(sorted(self._deconjugator.deconjugate(hira), key=lambda f: len(f.text), reverse=True))
+
     def _surface_reading(self, surface: str) -> str:
         # Tokenize the surface and join reading forms
         if self._segmenter._ffi is not None:
             out = self._segmenter._ffi.process_text(
-                self._segmenter._resources / "sudachi.json",
+                self._segmenter._config,
                 surface,
                 self._segmenter._dictionary_path,
                 mode="C",
                 print_all=True,
                 wakati=False,
             )
-            lines = [ln for ln in out.split("\n") if ln and ln != "EOS"]
+            # Blank and "EOS" lines have a single column, so the length check skips them too
             readings: list[str] = []
-            for ln in lines:
+            for ln in out.split("\n"):
                 parts = ln.split("\t")
                 if len(parts) > _READING_FORM_INDEX:
                     readings.append(parts[_READING_FORM_INDEX])
@@ -355,28 +375,28 @@ class ParserPort:
         tokens = tokenizer.tokenize(mode, surface)
         return "".join(t.reading_form() or "" for t in tokens)
 
+    def _reading_index(self, word_id: int, surface_or_reading: str) -> int | None:
+        return self._compute_reading_index(self._jmdict.words[word_id], surface_or_reading)
+
     @staticmethod
     def _compute_reading_index(jm: JmWord, surface_or_reading: str) -> int | None:
-        readings = list(jm.readings)
-        # Debug: ensure behavior consistent (can be toggled by commenting)
-        # print('CRI readings', readings, 'query', surface_or_reading)
+        # Indices follow the iteration order of jm.readings. Each pass stops at
+        # its first hit instead of normalizing every reading into a new list.
+        readings = jm.readings
         # exact spelling
-        try:
-            return readings.index(surface_or_reading)
-        except ValueError:
-            pass
+        if surface_or_reading in readings:
+            for i, r in enumerate(readings):
+                if r == surface_or_reading:
+                    return i
         hira_key = to_hiragana_preserve_long(surface_or_reading)
-        hira_readings = [to_hiragana_preserve_long(r) for r in readings]
-        try:
-            return hira_readings.index(hira_key)
-        except ValueError:
-            pass
+        for i, r in enumerate(readings):
+            if to_hiragana_preserve_long(r) == hira_key:
+                return i
         hira_key2 = to_hiragana_expand_long(surface_or_reading)
-        hira_readings2 = [to_hiragana_expand_long(r) for r in readings]
-        try:
-            return hira_readings2.index(hira_key2)
-        except ValueError:
-            return None
+        for i, r in enumerate(readings):
+            if to_hiragana_expand_long(r) == hira_key2:
+                return i
+        return None
 
     @staticmethod
     def _anchor_subwords(_w: WordInfo) -> list[DeckWord]:
@@ -384,21 +404,11 @@ class ParserPort:
 
 
 def is_ascii_or_fullwidth_letter(s: str) -> bool:
-    c = s[0]
-    return (
-        ("a" <= c <= "z")
-        or ("A" <= c <= "Z")
-        or (_FULLWIDTH_LOWER_A <= c <= _FULLWIDTH_LOWER_Z)
-        or (_FULLWIDTH_UPPER_A <= c <= _FULLWIDTH_UPPER_Z)
-    )
+    return s[0] in _ASCII_OR_FULLWIDTH_LETTERS
 
 
 def _is_kana(s: str) -> bool:
-    for ch in s:
-        o = ord(ch)
-        if not (_HIRAGANA_OR_KATAKANA_START <= o <= _HIRAGANA_OR_KATAKANA_END or o == _LONG_VOWEL_MARK):
-            return False
-    return True
+    return _KANA_ONLY_RE.fullmatch(s) is not None
 
 
 def _env_truthy(name: str) -> bool:
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-from jp_segment import segment
+from jp_segment import segment_batch
+
+try:
+    # Optional, as in jmdict_loader: orjson parses the cases faster than json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 def main() -> int:
@@ -13,12 +18,12 @@ def main() -> int:
     if not expected_path.exists():
         print("expected.json not found; add expected test cases before running.")
         return 2
-    entries = json.loads(expected_path.read_text(encoding="utf-8"))
+    entries = _json_loads(expected_path.read_bytes())
     failures = 0
-    for i, entry in enumerate(entries, 1):
+    results = segment_batch([entry["text"] for entry in entries])
+    for i, (entry, actual) in enumerate(zip(entries, results), 1):
         text = entry["text"]
         expected = entry["tokens"]
-        actual = segment(text)
         if actual != expected:
             failures += 1
             print(f"[{i}] MISMATCH\n  text:    {text}\n  expected:{expected}\n  actual:  {actual}")
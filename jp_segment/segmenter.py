@@ -1,23 +1,45 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import re
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from ._ffi import SudachiFFI
 from ._utils import detect_system_dic, find_resources_dir, is_romaji_only, to_full_width_digits
-from ._wordinfo import WordInfo
+from ._wordinfo import WordInfo, parse_sudachi_output
+
+if TYPE_CHECKING:
+    from .parser_port import ParserPort
+
+# Everything outside these ranges is dropped before analysis, like Jiten's interop
+_CLEAN_RE = re.compile(
+    r"[^\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF\uFF21-\uFF3A\uFF41-\uFF5A\uFF10-\uFF19"
+    r"\u3005\u3001-\u3003\u3008-\u3011\u3014-\u301F\uFF01-\uFF0F\uFF1A-\uFF1F\uFF3B-\uFF3F"
+    r"\uFF5B-\uFF60\uFF62-\uFF65\uFF0E\n\u2026\u3000\u2015\u2500() \u300D]"
+)
+# Longer inputs (whole documents) are analyzed without being memoized, so one
+# large text cannot stay pinned in the analysis cache
+_ANALYZE_CACHE_MAX_LENGTH = 512
 
 
 class Segmenter:
     def __init__(self, dictionary_path: str | Path | None = None) -> None:
         self._resources = find_resources_dir()
+        # Config paths are fixed per instance; build them once instead of on every analyze call
+        self._config = self._resources / "sudachi.json"
+        self._config_morphemes = self._resources / "sudachi_nouserdic.json"
         dic = detect_system_dic(str(dictionary_path) if dictionary_path else None)
         if dic is None:
             msg = "system.dic not found. Set JP_SEGMENT_SYSTEM_DIC or pass dictionary_path."
             raise FileNotFoundError(msg)
         self._dictionary_path = dic
         self._ffi: SudachiFFI | None = None
+        self._parser: ParserPort | None = None
+        self._sudachipy_tokenizers: dict[bool, tuple[Any, Any]] = {}
+        # Per-instance so results never cross dictionaries
+        self._ffi_analyze_cached = functools.lru_cache(maxsize=1024)(self._ffi_analyze_uncached)
         self._ensure_backend()
 
     def _ensure_backend(self) -> None:
@@ -27,28 +49,71 @@ class Segmenter:
         except Exception:
             self._ffi = None
 
+    def clear_cache(self) -> None:
+        """Drop the memoized morphological analyses of this Segmenter."""
+        self._ffi_analyze_cached.cache_clear()
+
     def _ffi_analyze(self, text: str, *, morphemes_only: bool = False) -> list[WordInfo]:
+        if len(text) > _ANALYZE_CACHE_MAX_LENGTH:
+            return list(self._ffi_analyze_uncached(text, morphemes_only))
+        # The words are shared with the cache: callers must not mutate them (apply_pipeline works on copies)
+        return list(self._ffi_analyze_cached(text, morphemes_only))
+
+    def _ffi_analyze_uncached(self, text: str, morphemes_only: bool) -> tuple[WordInfo, ...]:
         assert self._ffi is not None
-        config = self._resources / ("sudachi_nouserdic.json" if morphemes_only else "sudachi.json")
+        config = self._config_morphemes if morphemes_only else self._config
         mode = "A" if morphemes_only else "C"
-        # Clean like Jiten's interop
-        cleaned = re.sub(
-            (
-                r"[^\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF\uFF21-\uFF3A\uFF41-\uFF5A\uFF10-\uFF19"
-                r"\u3005\u3001-\u3003\u3008-\u3011\u3014-\u301F\uFF01-\uFF0F\uFF1A-\uFF1F\uFF3B-\uFF3F"
-                r"\uFF5B-\uFF60\uFF62-\uFF65\uFF0E\n\u2026\u3000\u2015\u2500() \u300D]"
-            ),
-            "",
-            to_full_width_digits(text),
-        )
+        # ASCII-only text (including "") can never contain kana or kanji, so it would be dropped after cleaning
+        if text.isascii():
+            return ()
+        cleaned = _CLEAN_RE.sub("", to_full_width_digits(text))
         if is_romaji_only(cleaned):
-            return []
+            return ()
         out = self._ffi.process_text(config, cleaned, self._dictionary_path, mode=mode, print_all=True, wakati=False)
-        lines = [ln for ln in out.split("\n") if ln and ln != "EOS"]
-        wis = [WordInfo.from_sudachi_line(ln) for ln in lines]
-        return [w for w in wis if not w.is_invalid]
+        return tuple(parse_sudachi_output(out))
+
+    def _ffi_analyze_many(self, texts: list[str], *, morphemes_only: bool = False) -> list[list[WordInfo]]:
+        """_ffi_analyze for several texts with a single native call."""
+        assert self._ffi is not None
+        config = self._config_morphemes if morphemes_only else self._config
+        mode = "A" if morphemes_only else "C"
+        results: list[list[WordInfo]] = [[] for _ in texts]
+        batch: list[int] = []
+        cleaned_texts: list[str] = []
+        for i, text in enumerate(texts):
+            if text.isascii():
+                continue
+            cleaned = _CLEAN_RE.sub("", to_full_width_digits(text))
+            if not is_romaji_only(cleaned):
+                batch.append(i)
+                cleaned_texts.append(cleaned)
+        outs = self._ffi.process_texts(config, cleaned_texts, self._dictionary_path, mode=mode, print_all=True)
+        for i, out in zip(batch, outs):
+            results[i] = parse_sudachi_output(out)
+        return results
 
     def _sudachipy_analyze(self, text: str, *, morphemes_only: bool = False) -> list[WordInfo]:
+        tokenizer, mode = self._sudachipy_tokenizer(morphemes_only)
+        tokens = tokenizer.tokenize(mode, text)
+        wis: list[WordInfo] = []
+        for t in tokens:
+            pos = list(t.part_of_speech())
+            wis.append(
+                WordInfo.from_fields(
+                    surface=t.surface(),
+                    pos=pos,
+                    normalized=t.normalized_form(),
+                    dictionary=t.dictionary_form(),
+                    reading=t.reading_form() or "",
+                )
+            )
+        return wis
+
+    def _sudachipy_tokenizer(self, morphemes_only: bool) -> tuple[Any, Any]:
+        # Building a Dictionary loads system.dic from disk, so keep one tokenizer per config
+        cached = self._sudachipy_tokenizers.get(morphemes_only)
+        if cached is not None:
+            return cached
         sudachi_dictionary = importlib.import_module("sudachipy.dictionary")
         sudachi_tokenizer = importlib.import_module("sudachipy.tokenizer")
 
@@ -102,31 +167,69 @@ class Segmenter:
 
         tokenizer = sudachi_dictionary.Dictionary(dict_type=None, config_path_or_dict=cfg).create()
         mode = getattr(sudachi_tokenizer.Tokenizer.SplitMode, "A" if morphemes_only else "C")
-        tokens = tokenizer.tokenize(mode, text)
-        wis: list[WordInfo] = []
-        for t in tokens:
-            pos = list(t.part_of_speech())
-            wis.append(
-                WordInfo.from_fields(
-                    surface=t.surface(),
-                    pos=pos,
-                    normalized=t.normalized_form(),
-                    dictionary=t.dictionary_form(),
-                    reading=t.reading_form() or "",
-                )
-            )
-        return wis
+        cached = (tokenizer, mode)
+        self._sudachipy_tokenizers[morphemes_only] = cached
+        return cached
 
     def segment(self, text: str, dictionary_path: str | Path | None = None) -> list[str]:
-        from .parser_port import ParserPort
+        if dictionary_path is not None:
+            dic = detect_system_dic(str(dictionary_path))
+            if dic is None or dic.resolve() != self._dictionary_path.resolve():
+                return _segmenter_for(dictionary_path, type(self)).segment(text)
+        return self._get_parser().parse_text_tokens(text)
 
-        segmenter_for_parser = self if dictionary_path is None else self.__class__(dictionary_path=dictionary_path)
-        parser = ParserPort(segmenter=segmenter_for_parser)
-        return parser.parse_text_tokens(text)
+    def segment_batch(self, texts: list[str]) -> list[list[str]]:
+        """Segment several texts; same results as calling segment() on each."""
+        return self._get_parser().parse_texts_tokens(texts)
+
+    def _get_parser(self) -> ParserPort:
+        # Built on first use: loading the deconjugator rules and JMdict is the
+        # expensive part of segmenting, so one parser serves every call
+        if self._parser is None:
+            from .parser_port import ParserPort
+
+            self._parser = ParserPort(segmenter=self)
+        return self._parser
 
 
 # No post-segmentation adapters: output is driven by JMdict anchoring + gaps
 
 
 def segment(text: str, dictionary_path: str | Path | None = None) -> list[str]:
-    return Segmenter(dictionary_path=dictionary_path).segment(text)
+    return _segmenter_for(dictionary_path).segment(text)
+
+
+def segment_batch(texts: list[str], dictionary_path: str | Path | None = None) -> list[list[str]]:
+    return _segmenter_for(dictionary_path).segment_batch(texts)
+
+
+def _segmenter_for(dictionary_path: str | Path | None, cls: type[Segmenter] = Segmenter) -> Segmenter:
+    dic = detect_system_dic(str(dictionary_path) if dictionary_path else None)
+    if dic is None:
+        # Raises the usual "system.dic not found" error
+        return cls(dictionary_path=dictionary_path)
+    return _shared_segmenter(cls, dic.resolve())
+
+
+@functools.lru_cache(maxsize=4)
+def _shared_segmenter(cls: type[Segmenter], dic: Path) -> Segmenter:
+    # Keyed on the class (so subclasses keep their overrides) and the absolute
+    # system.dic path, looked up on every call so a changed JP_SEGMENT_SYSTEM_DIC
+    # still takes effect and relative spellings of one file share an instance
+    return cls(dictionary_path=dic)
+
+
+def segment_cached(text: str, dictionary_path: str | Path | None = None) -> tuple[str, ...]:
+    # Same as segment(), memoized; returns a tuple so callers cannot mutate the cached result.
+    # The dictionary is looked up before the cache, as in _segmenter_for, so a changed
+    # JP_SEGMENT_SYSTEM_DIC is not answered from results of the old dictionary
+    dic = detect_system_dic(str(dictionary_path) if dictionary_path else None)
+    if dic is None:
+        # Raises the usual "system.dic not found" error
+        return tuple(segment(text, dictionary_path=dictionary_path))
+    return _segment_cached(text, dic.resolve())
+
+
+@functools.lru_cache(maxsize=1024)
+def _segment_cached(text: str, dic: Path) -> tuple[str, ...]:
+    return tuple(segment(text, dictionary_path=dic))